@@ -8,6 +8,12 @@ setup(
         "rich",
         "python-dotenv",
     ],
+    extras_require={
+        "dev": [
+            "pytest",
+            "pytest-xdist",
+        ],
+    },
     description="Python tools for managing Google Jules tasks",
     author="Windsurf Engineering",
 )
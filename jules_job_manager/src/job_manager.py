@@ -4,16 +4,75 @@ from __future__ import annotations
 
 import json
 import logging
+import re
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Protocol, Tuple, Union
 
 from rich.console import Console
 
 from src import models, storage
-
+from src import storage as _storage_module
+
+
+__all__ = (
+    "JobManager",
+    "create_job_manager",
+    "list_tasks",
+    "get_task",
+    "get_tasks",
+    "try_get_task",
+    "monitor_task",
+    "approve_plan",
+    "send_message",
+    "send_messages",
+    "resume_task",
+    "create_task",
+    "flush_pending_writes",
+)
 
 LOGGER = logging.getLogger(__name__)
+_INFO = logging.INFO
+
+
+class McpInvoker(Protocol):
+    """Structural type for objects that can invoke MCP tools."""
+
+    def invoke_tool(self, name: str, arguments: Dict[str, object]) -> Dict[str, object]:
+        """Invoke the named MCP tool and return its response envelope."""
+
+
+McpClientLike = Union[McpInvoker, Dict[str, Any]]
+
+_TASK_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+_BRANCH_PATTERN = re.compile(r"[A-Za-z0-9_\-/]+")
+_TASK_ID_FULLMATCH = _TASK_ID_PATTERN.fullmatch
+_BRANCH_FULLMATCH = _BRANCH_PATTERN.fullmatch
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+if orjson is not None:
+    _JSON_LOADS = orjson.loads
+else:
+    _JSON_LOADS = json.loads
+
+_CACHEABLE_TOOLS = frozenset(["jules_get_task"])
+_CACHE_MAX_ENTRIES = 1024
+
+_K_TASK_ID = sys.intern("taskId")
+_K_MESSAGE = sys.intern("message")
+_K_DESCRIPTION = sys.intern("description")
+_K_REPOSITORY = sys.intern("repository")
+_K_BRANCH = sys.intern("branch")
+_K_ERROR = sys.intern("error")
+_K_SUCCESS = sys.intern("success")
 
 
 def _sleep(duration: float) -> None:
@@ -68,16 +127,73 @@ def _ensure_callable(attribute_name: str, provider: Any) -> None:
     raise TypeError(message)
 
 
-def create_job_manager(mcp_client: Any, storage: Any) -> Dict[str, Any]:
-    """Create a job manager record holding validated dependencies.
+class JobManager:
+    """Slotted container for validated job manager dependencies.
+
+    Attribute access avoids the per-call dictionary lookups of the previous
+    dict-based record while ``__getitem__``/``get`` keep the mapping-style
+    access used by existing call sites working.
+    """
+
+    __slots__ = (
+        "mcp_client",
+        "storage",
+        "invoke",
+        "cache_ttl",
+        "writer",
+        "_tool_cache",
+        "_cache_lock",
+    )
+
+    def __init__(
+        self,
+        mcp_client: McpClientLike,
+        storage: Any,
+        cache_ttl: Optional[float] = None,
+        writer: Optional[Any] = None,
+    ) -> None:
+        self.mcp_client = mcp_client
+        self.storage = storage
+        self.invoke = _resolve_invoke_tool(mcp_client)
+        self.cache_ttl = cache_ttl
+        self.writer = writer
+        self._tool_cache: Dict[tuple, tuple] = {}
+        self._cache_lock = threading.RLock()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError as error:
+            raise KeyError(key) from error
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the named dependency or ``default`` when absent."""
+        return getattr(self, key, default)
+
+
+def create_job_manager(
+    mcp_client: McpClientLike,
+    storage: Any,
+    cache: bool = False,
+    cache_ttl_seconds: float = 30.0,
+    write_behind: bool = False,
+) -> JobManager:
+    """Create a job manager holding validated dependencies.
 
     Args:
-        mcp_client: Object capable of invoking MCP tools via ``invoke_tool``.
+        mcp_client: ``McpInvoker`` (or a dict exposing an ``invoke_tool``
+            callable) used to reach the MCP server. Invocations are
+            serialized under a per-manager lock unless the client exposes
+            a truthy ``thread_safe`` attribute (or key).
         storage: Storage manager responsible for persistence operations.
+        cache: Whether read-only MCP responses may be served from cache.
+        cache_ttl_seconds: How long cached responses stay fresh.
+        write_behind: Whether task saves are buffered through a background
+            writer instead of hitting disk synchronously.
 
     Returns:
-        A dictionary with ``mcp_client`` and ``storage`` keys referencing the
-        validated dependencies.
+        A ``JobManager`` exposing ``mcp_client`` and ``storage`` attributes
+        referencing the validated dependencies.
 
     Raises:
         ValueError: When either dependency is missing.
@@ -86,123 +202,314 @@ def create_job_manager(mcp_client: Any, storage: Any) -> Dict[str, Any]:
     validated_client = _validate_required_dependency("mcp_client", mcp_client)
     validated_storage = _validate_required_dependency("storage", storage)
     _ensure_callable("invoke_tool", validated_client)
-    manager: Dict[str, Any] = {}
-    manager["mcp_client"] = validated_client
-    manager["storage"] = validated_storage
+    cache_ttl = cache_ttl_seconds if cache else None
+    writer = _storage_module.StorageWriter(validated_storage) if write_behind else None
+    manager = JobManager(validated_client, validated_storage, cache_ttl, writer)
     return manager
 
 
-def list_tasks(manager: Dict[str, Any], status: Optional[str] = None) -> List[Dict[str, object]]:
+def list_tasks(
+    manager: JobManager,
+    status: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+) -> List[Dict[str, object]]:
     """Return normalized task dictionaries from the storage backend.
 
     Args:
-        manager: Job manager dictionary created by ``create_job_manager``.
+        manager: ``JobManager`` created by ``create_job_manager``.
         status: Optional status filter passed to storage.
+        fields: Optional projection; when given, rows contain only these
+            fields and skip full-object normalization.
 
     Returns:
-        A list of task dictionaries normalized via ``models.jules_task_from_dict``.
+        A list of task dictionaries normalized via ``models.jules_task_from_dict``,
+        or plain projected dictionaries when ``fields`` is provided.
     """
     storage_manager = manager.get("storage")
     if storage_manager is None:
         raise ValueError("Storage manager is missing")
-    LOGGER.info("Listing tasks", extra={"status": status})
+    writer = manager.get("writer")
+    if writer is not None:
+        writer.flush()
+    if LOGGER.isEnabledFor(_INFO):
+        LOGGER.info("Listing tasks", extra={"status": status})
+    if fields is not None:
+        return storage.list_tasks_projected(storage_manager, status, fields)
     raw_tasks = storage.list_tasks(storage_manager, status)
-    normalized: List[Dict[str, object]] = []
-    for entry in raw_tasks:
-        normalized.append(models.jules_task_from_dict(entry))
-    return normalized
+    return models.jules_tasks_from_dicts(raw_tasks)
 
 
+@lru_cache(maxsize=2048)
 def _validate_task_identifier(task_id: str) -> str:
-    """Ensure the provided task identifier is non-empty and well-formed."""
+    """Ensure the provided task identifier is non-empty and well-formed.
+
+    Successful validations are memoized; failures raise and are never cached.
+    """
     if task_id is None:
         raise ValueError("Task identifier is required")
     stripped = task_id.strip()
     if not stripped:
         raise ValueError("Task identifier cannot be blank")
-    allowed_characters = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_"
-    for character in stripped:
-        if character not in allowed_characters:
-            raise ValueError("Task identifier contains invalid characters")
+    if _TASK_ID_FULLMATCH(stripped) is None:
+        raise ValueError("Task identifier contains invalid characters")
     return stripped
 
 
-def _extract_response_text(response: Dict[str, object]) -> str:
+def _parse_response_payload(response: Dict[str, object], label: str) -> object:
+    """Extract the first structured or text payload from a response.
+
+    Structured transports may carry the payload directly as ``json`` or
+    ``data`` on a content item; that fast path skips the serialize/parse
+    detour entirely. Text payloads fall back to a single-pass JSON parse.
+    """
     content = response.get("content")
     if not isinstance(content, list):
         raise ValueError("Response content missing")
     for item in content:
         if not isinstance(item, dict):
             continue
+        structured_value = item.get("json")
+        if structured_value is None:
+            structured_value = item.get("data")
+        if structured_value is not None:
+            return structured_value
         text_value = item.get("text")
         if isinstance(text_value, str) and text_value.strip():
-            return text_value
+            try:
+                return _JSON_LOADS(text_value)
+            except ValueError as error:
+                raise ValueError(f"Unable to parse {label} payload") from error
     raise ValueError("Response content did not include text payload")
 
 
-def _invoke_mcp_tool(mcp_client: Any, name: str, arguments: Dict[str, object]) -> Dict[str, object]:
-    """Invoke an MCP tool regardless of client representation."""
-    handler = getattr(mcp_client, "invoke_tool", None)
-    if callable(handler):
-        return handler(name, arguments)
+def _cache_key(name: str, arguments: Dict[str, object]) -> tuple:
+    return (name, json.dumps(arguments, sort_keys=True))
+
+
+def _cache_lookup(manager: JobManager, name: str, arguments: Dict[str, object]) -> Optional[Dict[str, object]]:
+    """Return a fresh cached payload for a read-only tool call, if any."""
+    cache_ttl = manager.cache_ttl
+    if cache_ttl is None or name not in _CACHEABLE_TOOLS:
+        return None
+    key = _cache_key(name, arguments)
+    with manager._cache_lock:
+        entry = manager._tool_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, payload = entry
+        if time.monotonic() - stored_at >= cache_ttl:
+            del manager._tool_cache[key]
+            return None
+        return payload
+
+
+def _cache_store(manager: JobManager, name: str, arguments: Dict[str, object], payload: Dict[str, object], response: Dict[str, object]) -> None:
+    """Store a parsed read-only payload unless caching is off or refused."""
+    if manager.cache_ttl is None or name not in _CACHEABLE_TOOLS:
+        return
+    meta = response.get("_meta")
+    if isinstance(meta, dict) and meta.get("cache_hint") == "no-cache":
+        return
+    key = _cache_key(name, arguments)
+    with manager._cache_lock:
+        cache = manager._tool_cache
+        if len(cache) >= _CACHE_MAX_ENTRIES and key not in cache:
+            oldest_key = next(iter(cache))
+            del cache[oldest_key]
+        cache[key] = (time.monotonic(), payload)
+
+
+def _require_dependencies(manager: JobManager) -> Tuple[Any, Any]:
+    """Unpack the MCP client and storage manager once per public call."""
+    mcp_client = manager.get("mcp_client")
+    if mcp_client is None:
+        raise ValueError("MCP client is missing")
+    storage_manager = manager.get("storage")
+    if storage_manager is None:
+        raise ValueError("Storage manager is missing")
+    return mcp_client, storage_manager
+
+
+def _read_stored_task(manager: JobManager, storage_manager: Any, task_id: str) -> Dict[str, object]:
+    """Read a task from storage, draining the write-behind buffer first.
+
+    Without the flush, a manager created with ``write_behind=True`` could
+    fail to see its own just-buffered saves (create_task followed by
+    send_message would miss the new task).
+    """
+    writer = manager.get("writer")
+    if writer is not None:
+        writer.flush()
+    return storage.get_task(storage_manager, task_id)
+
+
+def _persist_task(manager: JobManager, storage_manager: Any, task: Dict[str, object]) -> None:
+    """Save a task synchronously or through the write-behind buffer."""
+    writer = manager.get("writer")
+    if writer is not None:
+        writer.save(task)
+        return
+    storage.save_task(storage_manager, task)
+
+
+def flush_pending_writes(manager: JobManager) -> None:
+    """Block until write-behind saves (if enabled) have reached disk."""
+    writer = manager.get("writer")
+    if writer is not None:
+        writer.flush()
+
+
+def _client_is_thread_safe(mcp_client: McpClientLike) -> bool:
+    """Return whether the client declares its invoke_tool as thread-safe."""
     if isinstance(mcp_client, dict):
-        candidate = mcp_client.get("invoke_tool")
-        if callable(candidate):
-            return candidate(name, arguments)
-    raise ValueError("MCP client cannot invoke tools")
+        return bool(mcp_client.get("thread_safe"))
+    return bool(getattr(mcp_client, "thread_safe", False))
 
 
-def get_task(manager: Dict[str, Any], task_id: str) -> Dict[str, object]:
-    """Fetch task details from the MCP server and persist them locally.
+def _resolve_invoke_tool(mcp_client: McpClientLike):
+    """Resolve the client's tool-invocation callable once, up front.
+
+    The stdio transport in ``mcp_client`` multiplexes one pipe with no
+    per-request locking, so unless the client declares ``thread_safe``
+    the resolved callable is wrapped in a lock to keep concurrent
+    fan-out calls from interleaving frames and swapping responses.
+    """
+    handler = getattr(mcp_client, "invoke_tool", None)
+    if not callable(handler):
+        if isinstance(mcp_client, dict):
+            handler = mcp_client.get("invoke_tool")
+        if not callable(handler):
+            raise ValueError("MCP client cannot invoke tools")
+    if _client_is_thread_safe(mcp_client):
+        return handler
+    invoke_lock = threading.Lock()
+
+    def _locked_invoke(name: str, arguments: Dict[str, object]) -> Dict[str, object]:
+        with invoke_lock:
+            return handler(name, arguments)
+
+    return _locked_invoke
+
+
+def try_get_task(manager: JobManager, task_id: str) -> Optional[Dict[str, object]]:
+    """Fetch task details, returning ``None`` when the task does not exist.
+
+    Polling loops that expect ``not_found`` can use this variant to avoid
+    paying exception-raising overhead on the common miss path.
 
     Args:
-        manager: Job manager dictionary produced by ``create_job_manager``.
+        manager: ``JobManager`` produced by ``create_job_manager``.
         task_id: Identifier of the task to retrieve.
 
     Returns:
-        Normalized Jules task dictionary.
+        Normalized Jules task dictionary, or ``None`` when not found.
 
     Raises:
         ValueError: When dependencies, identifiers, or payloads are invalid.
-        KeyError: If the task cannot be found by the MCP server.
         RuntimeError: When MCP invocation fails.
     """
     validated_id = _validate_task_identifier(task_id)
-    mcp_client = manager.get("mcp_client")
-    if mcp_client is None:
-        raise ValueError("MCP client is missing")
-    storage_manager = manager.get("storage")
-    if storage_manager is None:
-        raise ValueError("Storage manager is missing")
-    LOGGER.info("Fetching task from MCP", extra={"task_id": validated_id})
+    mcp_client, storage_manager = _require_dependencies(manager)
+    arguments = {_K_TASK_ID: validated_id}
+    cached_data = _cache_lookup(manager, "jules_get_task", arguments)
+    if cached_data is not None:
+        if LOGGER.isEnabledFor(_INFO):
+            LOGGER.info("Serving task from cache", extra={"task_id": validated_id})
+        return models.normalize_task_dict(cached_data)
+    if LOGGER.isEnabledFor(_INFO):
+        LOGGER.info("Fetching task from MCP", extra={"task_id": validated_id})
     try:
-        response = _invoke_mcp_tool(mcp_client, "jules_get_task", {"taskId": validated_id})
+        response = manager.invoke("jules_get_task", arguments)
     except Exception as error:  # noqa: BLE001
         LOGGER.error("MCP invocation failed", extra={"task_id": validated_id})
         raise RuntimeError("Failed to fetch task from MCP") from error
-    text_payload = _extract_response_text(response)
-    try:
-        raw_data = json.loads(text_payload)
-    except json.JSONDecodeError as error:
-        raise ValueError("Unable to parse task payload") from error
-    if isinstance(raw_data, dict) and raw_data.get("error") == "not_found":
-        raise KeyError(f"Task '{validated_id}' not found")
+    raw_data = _parse_response_payload(response, "task")
+    if isinstance(raw_data, dict) and raw_data.get(_K_ERROR) == "not_found":
+        return None
     if not isinstance(raw_data, dict):
         raise ValueError("Task payload must be a dictionary")
-    normalized_task = models.jules_task_from_dict(raw_data)
-    serialized_task = models.jules_task_to_dict(normalized_task)
-    storage.save_task(storage_manager, serialized_task)
+    _cache_store(manager, "jules_get_task", arguments, raw_data, response)
+    normalized_task = models.normalize_task_dict(raw_data)
+    _persist_task(manager, storage_manager, normalized_task)
     return normalized_task
 
 
-def monitor_task(manager: Dict[str, Any], task_id: str, interval: int = 30) -> None:
+def get_task(manager: JobManager, task_id: str) -> Dict[str, object]:
+    """Fetch task details from the MCP server and persist them locally.
+
+    Args:
+        manager: ``JobManager`` produced by ``create_job_manager``.
+        task_id: Identifier of the task to retrieve.
+
+    Returns:
+        Normalized Jules task dictionary.
+
+    Raises:
+        ValueError: When dependencies, identifiers, or payloads are invalid.
+        KeyError: If the task cannot be found by the MCP server.
+        RuntimeError: When MCP invocation fails.
+    """
+    task = try_get_task(manager, task_id)
+    if task is None:
+        validated_id = _validate_task_identifier(task_id)
+        raise KeyError(f"Task '{validated_id}' not found")
+    return task
+
+
+def get_tasks(
+    manager: JobManager,
+    task_ids: List[str],
+    max_workers: int = 8,
+) -> List[Dict[str, object]]:
+    """Fetch several tasks concurrently to amortize per-call MCP latency.
+
+    RPCs overlap only when the client declares itself ``thread_safe``;
+    otherwise they serialize on the manager's invoke lock and only the
+    storage and normalization work overlaps.
+
+    Args:
+        manager: ``JobManager`` produced by ``create_job_manager``.
+        task_ids: Identifiers of the tasks to retrieve.
+        max_workers: Upper bound on concurrent MCP invocations.
+
+    Returns:
+        Normalized task dictionaries in the same order as ``task_ids``.
+
+    Raises:
+        ValueError: When identifiers or dependencies are invalid.
+        KeyError: If any task cannot be found by the MCP server.
+        RuntimeError: When MCP invocation fails.
+    """
+    validated_ids: List[str] = []
+    for task_id in task_ids:
+        validated_ids.append(_validate_task_identifier(task_id))
+    if not validated_ids:
+        return []
+    worker_count = min(max_workers, len(validated_ids))
+    if worker_count <= 1:
+        results: List[Dict[str, object]] = []
+        for validated_id in validated_ids:
+            results.append(get_task(manager, validated_id))
+        return results
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        futures = []
+        for validated_id in validated_ids:
+            futures.append(executor.submit(get_task, manager, validated_id))
+        results = []
+        for future in futures:
+            results.append(future.result())
+    return results
+
+
+def monitor_task(manager: JobManager, task_id: str, interval: int = 30) -> None:
     """Monitor task status changes by polling the MCP server."""
 
     validated_id = _validate_task_identifier(task_id)
     duration = _validate_monitor_interval(interval)
     console = _create_console()
     previous_status: Optional[str] = None
-    LOGGER.info("Starting task monitoring", extra={"task_id": validated_id, "interval": duration})
+    if LOGGER.isEnabledFor(_INFO):
+        LOGGER.info("Starting task monitoring", extra={"task_id": validated_id, "interval": duration})
     console.print(f"Monitoring task {validated_id}")
     try:
         while True:
@@ -216,32 +523,35 @@ def monitor_task(manager: Dict[str, Any], task_id: str, interval: int = 30) -> N
             timestamp_text = timestamp_value.strftime("%Y-%m-%d %H:%M:%S %Z")
             message_text = _format_monitor_message(timestamp_text, current_status, previous_status)
             console.print(message_text)
-            LOGGER.info(
-                "Task status polled",
-                extra={
-                    "task_id": validated_id,
-                    "status": current_status,
-                    "previous_status": previous_status,
-                },
-            )
+            if LOGGER.isEnabledFor(_INFO):
+                LOGGER.info(
+                    "Task status polled",
+                    extra={
+                        "task_id": validated_id,
+                        "status": current_status,
+                        "previous_status": previous_status,
+                    },
+                )
             previous_status = current_status
             if current_status == "completed":
                 completion_time = datetime.now().astimezone()
                 completion_text = completion_time.strftime("%Y-%m-%d %H:%M:%S %Z")
                 console.print(f"[{completion_text}] Task {validated_id} completed.")
-                LOGGER.info("Task completed during monitoring", extra={"task_id": validated_id})
+                if LOGGER.isEnabledFor(_INFO):
+                    LOGGER.info("Task completed during monitoring", extra={"task_id": validated_id})
                 break
             _sleep(duration)
     except KeyboardInterrupt:
         console.print("Monitoring stopped by user.")
-        LOGGER.info("Monitoring interrupted by user", extra={"task_id": validated_id})
+        if LOGGER.isEnabledFor(_INFO):
+            LOGGER.info("Monitoring interrupted by user", extra={"task_id": validated_id})
 
 
-def approve_plan(manager: Dict[str, Any], task_id: str) -> bool:
+def approve_plan(manager: JobManager, task_id: str) -> bool:
     """Approve a plan via MCP and update task status.
 
     Args:
-        manager: Job manager dictionary produced by ``create_job_manager``.
+        manager: ``JobManager`` produced by ``create_job_manager``.
         task_id: Identifier for the task awaiting approval.
 
     Returns:
@@ -254,36 +564,28 @@ def approve_plan(manager: Dict[str, Any], task_id: str) -> bool:
     """
 
     validated_id = _validate_task_identifier(task_id)
-    mcp_client = manager.get("mcp_client")
-    if mcp_client is None:
-        raise ValueError("MCP client is missing")
-    storage_manager = manager.get("storage")
-    if storage_manager is None:
-        raise ValueError("Storage manager is missing")
-    existing_task = storage.get_task(storage_manager, validated_id)
+    mcp_client, storage_manager = _require_dependencies(manager)
+    existing_task = _read_stored_task(manager, storage_manager, validated_id)
     normalized_task = models.jules_task_from_dict(existing_task)
     current_status = normalized_task.get("status")
     if current_status != "waiting_approval":
         raise ValueError("Task must be waiting for approval")
-    payload = {"taskId": validated_id}
-    LOGGER.info("Approving plan via MCP", extra=payload)
+    payload = {_K_TASK_ID: validated_id}
+    if LOGGER.isEnabledFor(_INFO):
+        LOGGER.info("Approving plan via MCP", extra=payload)
     try:
-        response = _invoke_mcp_tool(mcp_client, "jules_approve_plan", payload)
+        response = manager.invoke("jules_approve_plan", payload)
     except Exception as error:  # noqa: BLE001
         LOGGER.error("MCP invocation failed", extra={"task_id": validated_id})
         raise RuntimeError("Failed to approve plan via MCP") from error
-    text_payload = _extract_response_text(response)
-    try:
-        raw_data = json.loads(text_payload)
-    except json.JSONDecodeError as error:
-        raise ValueError("Unable to parse approval payload") from error
+    raw_data = _parse_response_payload(response, "approval")
     if not isinstance(raw_data, dict):
         raise ValueError("Approval payload must be a dictionary")
-    success_value = raw_data.get("success")
+    success_value = raw_data.get(_K_SUCCESS)
     if success_value is False:
         return False
-    if raw_data.get("error"):
-        message_text = str(raw_data.get("error"))
+    if raw_data.get(_K_ERROR):
+        message_text = str(raw_data.get(_K_ERROR))
         raise RuntimeError(f"MCP plan approval failed: {message_text}")
     if success_value is None:
         raise ValueError("Approval payload missing success indicator")
@@ -292,7 +594,7 @@ def approve_plan(manager: Dict[str, Any], task_id: str) -> bool:
     normalized_task["status"] = "in_progress"
     normalized_task["updated_at"] = datetime.now().astimezone()
     serialized_task = models.jules_task_to_dict(normalized_task)
-    storage.save_task(storage_manager, serialized_task)
+    _persist_task(manager, storage_manager, serialized_task)
     return True
 
 
@@ -305,11 +607,11 @@ def _validate_message_content(message: str) -> str:
     return stripped
 
 
-def send_message(manager: Dict[str, Any], task_id: str, message: str) -> bool:
+def send_message(manager: JobManager, task_id: str, message: str) -> bool:
     """Send a chat message through MCP and record it in storage.
 
     Args:
-        manager: Job manager dictionary produced by ``create_job_manager``.
+        manager: ``JobManager`` produced by ``create_job_manager``.
         task_id: Identifier of the target task.
         message: Message content to deliver.
 
@@ -324,33 +626,25 @@ def send_message(manager: Dict[str, Any], task_id: str, message: str) -> bool:
 
     validated_id = _validate_task_identifier(task_id)
     validated_message = _validate_message_content(message)
-    mcp_client = manager.get("mcp_client")
-    if mcp_client is None:
-        raise ValueError("MCP client is missing")
-    storage_manager = manager.get("storage")
-    if storage_manager is None:
-        raise ValueError("Storage manager is missing")
-    existing_task = storage.get_task(storage_manager, validated_id)
-    normalized_task = models.jules_task_from_dict(existing_task)
-    payload = {"taskId": validated_id, "message": validated_message}
-    LOGGER.info("Sending message via MCP", extra=payload)
+    mcp_client, storage_manager = _require_dependencies(manager)
+    existing_task = _read_stored_task(manager, storage_manager, validated_id)
+    normalized_task = models.normalize_task_dict(existing_task, trusted=True)
+    payload = {_K_TASK_ID: validated_id, _K_MESSAGE: validated_message}
+    if LOGGER.isEnabledFor(_INFO):
+        LOGGER.info("Sending message via MCP", extra={"task_id": validated_id})
     try:
-        response = _invoke_mcp_tool(mcp_client, "jules_send_message", payload)
+        response = manager.invoke("jules_send_message", payload)
     except Exception as error:  # noqa: BLE001
         LOGGER.error("MCP invocation failed", extra={"task_id": validated_id})
         raise RuntimeError("Failed to send message via MCP") from error
-    text_payload = _extract_response_text(response)
-    try:
-        raw_data = json.loads(text_payload)
-    except json.JSONDecodeError as error:
-        raise ValueError("Unable to parse message payload") from error
+    raw_data = _parse_response_payload(response, "message")
     if not isinstance(raw_data, dict):
         raise ValueError("Message payload must be a dictionary")
-    success_value = raw_data.get("success")
+    success_value = raw_data.get(_K_SUCCESS)
     if success_value is False:
         return False
-    if raw_data.get("error"):
-        message_text = str(raw_data.get("error"))
+    if raw_data.get(_K_ERROR):
+        message_text = str(raw_data.get(_K_ERROR))
         raise RuntimeError(f"MCP message send failed: {message_text}")
     if success_value is None:
         raise ValueError("Message payload missing success indicator")
@@ -361,47 +655,95 @@ def send_message(manager: Dict[str, Any], task_id: str, message: str) -> bool:
         history = []
         normalized_task["chat_history"] = history
     history.append(models.create_chat_message("user", validated_message))
-    serialized_task = models.jules_task_to_dict(normalized_task)
-    storage.save_task(storage_manager, serialized_task)
+    _persist_task(manager, storage_manager, normalized_task)
     return True
 
 
 
 
-def resume_task(manager: Dict[str, Any], task_id: str) -> bool:
+def send_messages(
+    manager: JobManager,
+    messages: List[tuple],
+    max_workers: int = 8,
+) -> List[bool]:
+    """Send several chat messages concurrently to amortize MCP latency.
+
+    RPCs overlap only when the client declares itself ``thread_safe``;
+    otherwise they serialize on the manager's invoke lock. Messages for
+    the same task always run sequentially.
+
+    Args:
+        manager: ``JobManager`` produced by ``create_job_manager``.
+        messages: ``(task_id, message)`` pairs to deliver.
+        max_workers: Upper bound on concurrent MCP invocations.
+
+    Returns:
+        Per-pair success booleans in the same order as ``messages``.
+
+    Raises:
+        ValueError: When inputs or dependencies are invalid.
+        KeyError: If any referenced task does not exist in storage.
+        RuntimeError: When MCP invocation fails or reports an error payload.
+    """
+    validated_pairs: List[tuple] = []
+    for task_id, message in messages:
+        validated_pairs.append(
+            (_validate_task_identifier(task_id), _validate_message_content(message))
+        )
+    if not validated_pairs:
+        return []
+    buckets: Dict[str, List[int]] = {}
+    for position, (validated_id, _) in enumerate(validated_pairs):
+        buckets.setdefault(validated_id, []).append(position)
+    worker_count = min(max_workers, len(buckets))
+    results: List[bool] = [False] * len(validated_pairs)
+    if worker_count <= 1:
+        for position, (validated_id, validated_message) in enumerate(validated_pairs):
+            results[position] = send_message(manager, validated_id, validated_message)
+        return results
+
+    def _send_bucket(positions: List[int]) -> None:
+        # Messages for the same task run sequentially so concurrent
+        # read-modify-write cycles cannot drop chat history entries.
+        for position in positions:
+            validated_id, validated_message = validated_pairs[position]
+            results[position] = send_message(manager, validated_id, validated_message)
+
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        futures = []
+        for positions in buckets.values():
+            futures.append(executor.submit(_send_bucket, positions))
+        for future in futures:
+            future.result()
+    return results
+
+
+def resume_task(manager: JobManager, task_id: str) -> bool:
     """Resume a paused task via MCP and update local storage."""
 
     validated_id = _validate_task_identifier(task_id)
-    mcp_client = manager.get("mcp_client")
-    if mcp_client is None:
-        raise ValueError("MCP client is missing")
-    storage_manager = manager.get("storage")
-    if storage_manager is None:
-        raise ValueError("Storage manager is missing")
-    existing_task = storage.get_task(storage_manager, validated_id)
+    mcp_client, storage_manager = _require_dependencies(manager)
+    existing_task = _read_stored_task(manager, storage_manager, validated_id)
     normalized_task = models.jules_task_from_dict(existing_task)
     current_status = normalized_task.get("status")
     if current_status != "paused":
         raise ValueError("Task must be paused to resume")
-    payload = {"taskId": validated_id}
-    LOGGER.info("Resuming task via MCP", extra=payload)
+    payload = {_K_TASK_ID: validated_id}
+    if LOGGER.isEnabledFor(_INFO):
+        LOGGER.info("Resuming task via MCP", extra=payload)
     try:
-        response = _invoke_mcp_tool(mcp_client, "jules_resume_task", payload)
+        response = manager.invoke("jules_resume_task", payload)
     except Exception as error:  # noqa: BLE001
         LOGGER.error("MCP invocation failed", extra={"task_id": validated_id})
         raise RuntimeError("Failed to resume task via MCP") from error
-    text_payload = _extract_response_text(response)
-    try:
-        raw_data = json.loads(text_payload)
-    except json.JSONDecodeError as error:
-        raise ValueError("Unable to parse resume payload") from error
+    raw_data = _parse_response_payload(response, "resume")
     if not isinstance(raw_data, dict):
         raise ValueError("Resume payload must be a dictionary")
-    success_value = raw_data.get("success")
+    success_value = raw_data.get(_K_SUCCESS)
     if success_value is False:
         return False
-    if raw_data.get("error"):
-        message_text = str(raw_data.get("error"))
+    if raw_data.get(_K_ERROR):
+        message_text = str(raw_data.get(_K_ERROR))
         raise RuntimeError(f"MCP task resume failed: {message_text}")
     if success_value is None:
         raise ValueError("Resume payload missing success indicator")
@@ -410,9 +752,10 @@ def resume_task(manager: Dict[str, Any], task_id: str) -> bool:
     normalized_task["status"] = "in_progress"
     normalized_task["updated_at"] = datetime.now().astimezone()
     serialized_task = models.jules_task_to_dict(normalized_task)
-    storage.save_task(storage_manager, serialized_task)
+    _persist_task(manager, storage_manager, serialized_task)
     return True
 
+@lru_cache(maxsize=2048)
 def _validate_repository(repository: str) -> str:
     if repository is None:
         raise ValueError("Repository is required")
@@ -439,10 +782,8 @@ def _normalize_branch(branch: Optional[str]) -> str:
     stripped = branch.strip()
     if not stripped:
         return "main"
-    allowed = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_/"
-    for character in stripped:
-        if character not in allowed:
-            raise ValueError("Branch contains invalid characters")
+    if _BRANCH_FULLMATCH(stripped) is None:
+        raise ValueError("Branch contains invalid characters")
     return stripped
 
 
@@ -473,7 +814,7 @@ def _format_monitor_message(timestamp: str, status: str, previous_status: Option
 
 
 def create_task(
-    manager: Dict[str, Any],
+    manager: JobManager,
     description: str,
     repository: str,
     branch: Optional[str] = None,
@@ -481,7 +822,7 @@ def create_task(
     """Create a new task via MCP and persist the returned task locally.
 
     Args:
-        manager: Job manager dictionary produced by ``create_job_manager``.
+        manager: ``JobManager`` produced by ``create_job_manager``.
         description: Text describing the work item to schedule.
         repository: Target repository in ``owner/name`` format.
         branch: Optional branch name (defaults to ``main``).
@@ -497,34 +838,25 @@ def create_task(
     validated_description = _validate_description(description)
     validated_repository = _validate_repository(repository)
     normalized_branch = _normalize_branch(branch)
-    mcp_client = manager.get("mcp_client")
-    if mcp_client is None:
-        raise ValueError("MCP client is missing")
-    storage_manager = manager.get("storage")
-    if storage_manager is None:
-        raise ValueError("Storage manager is missing")
+    mcp_client, storage_manager = _require_dependencies(manager)
     payload = {
-        "description": validated_description,
-        "repository": validated_repository,
-        "branch": normalized_branch,
+        _K_DESCRIPTION: validated_description,
+        _K_REPOSITORY: validated_repository,
+        _K_BRANCH: normalized_branch,
     }
-    LOGGER.info("Creating task via MCP", extra=payload)
+    if LOGGER.isEnabledFor(_INFO):
+        LOGGER.info("Creating task via MCP", extra=payload)
     try:
-        response = _invoke_mcp_tool(mcp_client, "jules_create_task", payload)
+        response = manager.invoke("jules_create_task", payload)
     except Exception as error:  # noqa: BLE001
         LOGGER.error("MCP invocation failed", extra=payload)
         raise RuntimeError("Failed to create task via MCP") from error
-    text_payload = _extract_response_text(response)
-    try:
-        raw_data = json.loads(text_payload)
-    except json.JSONDecodeError as error:
-        raise ValueError("Unable to parse task payload") from error
-    if isinstance(raw_data, dict) and raw_data.get("error"):
-        message = str(raw_data.get("error"))
+    raw_data = _parse_response_payload(response, "task")
+    if isinstance(raw_data, dict) and raw_data.get(_K_ERROR):
+        message = str(raw_data.get(_K_ERROR))
         raise RuntimeError(f"MCP task creation failed: {message}")
     if not isinstance(raw_data, dict):
         raise ValueError("Task payload must be a dictionary")
-    normalized_task = models.jules_task_from_dict(raw_data)
-    serialized_task = models.jules_task_to_dict(normalized_task)
-    storage.save_task(storage_manager, serialized_task)
+    normalized_task = models.normalize_task_dict(raw_data)
+    _persist_task(manager, storage_manager, normalized_task)
     return normalized_task
@@ -2,24 +2,70 @@
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
+import os
+import queue
 import select
+import struct
 import subprocess
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional wire format
+    msgpack = None
 
 DEFAULT_TIMEOUT_SECONDS = 5.0
+WIRE_FORMATS = ("json", "msgpack")
+_PIPELINE_CHUNK = 64
 LOGGER = logging.getLogger(__name__)
 
+if orjson is not None:
+    _LOADS = orjson.loads
+    _DUMPS_BYTES = orjson.dumps
+else:
+    _LOADS = json.loads
+
+    def _DUMPS_BYTES(payload: object) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+_ENVELOPE_CACHE: Dict[str, bytes] = {}
+
+
+def _serialize_request_frame(method: str, params: Dict[str, object], request_id: str) -> bytes:
+    """Assemble a JSON-RPC frame reusing a cached per-method envelope prefix."""
+    prefix = _ENVELOPE_CACHE.get(method)
+    if prefix is None:
+        prefix = b'{"jsonrpc": "2.0", "method": ' + _DUMPS_BYTES(method) + b', "id": '
+        _ENVELOPE_CACHE[method] = prefix
+    return prefix + _DUMPS_BYTES(request_id) + b', "params": ' + _DUMPS_BYTES(params) + b"}\n"
+
+
+def dumps_json_compact(payload: object) -> bytes:
+    """Serialize a payload to compact JSON bytes for the wire."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
 
 def dumps_json(payload: Dict[str, object]) -> str:
-    """Serialize dictionaries to JSON with stable formatting."""
+    """Serialize dictionaries to pretty JSON for config files and humans."""
+    if orjson is not None:
+        options = orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
+        return orjson.dumps(payload, option=options).decode("utf-8")
     return json.dumps(payload, indent=2, sort_keys=True)
 
 
 def loads_json(content: str) -> Dict[str, object]:
     """Parse JSON content into a dictionary."""
-    data = json.loads(content)
+    data = _LOADS(content)
     if not isinstance(data, dict):
         raise ValueError("Configuration JSON must deserialize into a dictionary")
     return data
@@ -47,56 +93,139 @@ def _validate_config(config: Dict[str, object]) -> Dict[str, object]:
     normalized["server_path"] = str(server_path)
     normalized["node_path"] = str(node_path)
     normalized["timeout"] = _normalize_timeout(config.get("timeout_seconds"))
+    wire_format = config.get("wire_format", "json")
+    if wire_format not in WIRE_FORMATS:
+        raise ValueError("Configuration wire_format must be 'json' or 'msgpack'")
+    if wire_format == "msgpack" and msgpack is None:
+        raise ValueError("msgpack wire format requires the msgpack package")
+    normalized["wire_format"] = wire_format
     process = config.get("process")
     normalized["process"] = process
     normalized["active_contexts"] = 0
     return normalized
 
 
-def create_client(config: Dict[str, object]) -> Dict[str, object]:
-    """Create a client dictionary from an in-memory configuration."""
+class MCPClient:
+    """Slotted record describing an MCP server subprocess connection.
+
+    Attribute access replaces the dictionary lookups of the previous
+    dict-based record; ``__getitem__``/``__setitem__``/``get`` keep the
+    mapping-style access used by existing call sites working.
+    """
+
+    __slots__ = (
+        "server_path",
+        "node_path",
+        "timeout",
+        "wire_format",
+        "process",
+        "active_contexts",
+        "_request_id_generator",
+        "_rx_buffer",
+    )
+
+    def __init__(
+        self,
+        server_path: str,
+        node_path: str,
+        timeout: float,
+        process: Optional[subprocess.Popen] = None,
+        wire_format: str = "json",
+    ) -> None:
+        self.server_path = server_path
+        self.node_path = node_path
+        self.timeout = timeout
+        self.wire_format = wire_format
+        self.process = process
+        self.active_contexts = 0
+        self._request_id_generator = None
+        self._rx_buffer = bytearray()
+
+    def __getitem__(self, key: str) -> object:
+        try:
+            return getattr(self, key)
+        except AttributeError as error:
+            raise KeyError(key) from error
+
+    def __setitem__(self, key: str, value: object) -> None:
+        try:
+            setattr(self, key, value)
+        except AttributeError as error:
+            raise KeyError(key) from error
+
+    def get(self, key: str, default: object = None) -> object:
+        """Return the named field or ``default`` when absent."""
+        return getattr(self, key, default)
+
+
+def create_client(config: Dict[str, object]) -> MCPClient:
+    """Create a client record from an in-memory configuration."""
     validated = _validate_config(config)
-    client: Dict[str, object] = {}
-    for key, value in validated.items():
-        client[key] = value
+    client = MCPClient(
+        str(validated["server_path"]),
+        str(validated["node_path"]),
+        float(validated["timeout"]),
+        validated["process"],
+        str(validated["wire_format"]),
+    )
     return client
 
 
-def create_client_from_file(config_path: str) -> Dict[str, object]:
-    """Load configuration from a JSON file and create a client."""
-    with open(config_path, "r", encoding="utf-8") as handle:
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Dict[str, object]]] = {}
+
+
+def _load_config_cached(config_path: str) -> Dict[str, object]:
+    """Parse a config file, reusing the parsed dict while the file is unchanged.
+
+    One entry is kept per path (replaced when the file's mtime or size
+    changes), so processes alternating between several config files keep
+    reusing each parse.
+    """
+    result = os.stat(config_path)
+    entry = _CONFIG_CACHE.get(config_path)
+    if entry is not None and entry[0] == result.st_mtime_ns and entry[1] == result.st_size:
+        return entry[2]
+    with open(config_path, "rb") as handle:
         content = handle.read()
-    config = loads_json(content)
+    parsed = loads_json(content)
+    _CONFIG_CACHE[config_path] = (result.st_mtime_ns, result.st_size, parsed)
+    return parsed
+
+
+def create_client_from_file(config_path: str) -> MCPClient:
+    """Load configuration from a JSON file and create a client.
+
+    Parsed configs are cached keyed by path, mtime, and size, so repeated
+    client construction from an unchanged file skips the read and parse.
+    """
+    config = _load_config_cached(config_path)
     return create_client(config)
 
 
 def popen_launch(executable: str, args: Iterable[str]) -> subprocess.Popen:
     """Launch the MCP server process using subprocess.Popen."""
-    arguments_list = []
-    for item in args:
-        arguments_list.append(item)
     return subprocess.Popen(  # nosec B603
-        [executable] + arguments_list,
+        [executable, *args],
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
+        text=False,
     )
 
 
-def _ensure_not_running(client: Dict[str, object]) -> None:
-    process = client.get("process")
+def _ensure_not_running(client: MCPClient) -> None:
+    process = client.process
     if process is not None:
         if process.poll() is None:
             raise RuntimeError("MCP client already running")
-    client["process"] = None
+    client.process = None
 
 
-def start_client(client: Dict[str, object]) -> bool:
+def start_client(client: MCPClient) -> bool:
     """Start the MCP server subprocess for the given client."""
     _ensure_not_running(client)
-    executable = client["node_path"]
-    args = [client["server_path"]]
+    executable = client.node_path
+    args = [client.server_path]
     LOGGER.info("Starting MCP server", extra={"executable": executable, "args": args})
     try:
         process = popen_launch(executable, args)
@@ -104,11 +233,35 @@ def start_client(client: Dict[str, object]) -> bool:
         LOGGER.error("Failed to start MCP server", exc_info=True)
         message = f"Failed to start MCP server: {error}"
         raise RuntimeError(message) from error
-    client["process"] = process
+    client.process = process
     return True
 
 
 def _wait_for_process(process: subprocess.Popen, timeout: float) -> None:
+    """Wait for exit, using a pidfd readable-on-exit wait where available.
+
+    The pidfd path lets the kernel signal exit directly instead of the
+    busy-wait loop inside ``Popen.wait(timeout=...)``; stubs and
+    non-Linux platforms fall back to the plain wait.
+    """
+    pid = getattr(process, "pid", None)
+    if pid is not None and hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(pid)
+        except OSError:
+            pidfd = None
+        if pidfd is not None:
+            try:
+                readable, _, _ = select.select([pidfd], [], [], timeout)
+            finally:
+                os.close(pidfd)
+            if not readable:
+                raise TimeoutError()
+            try:
+                process.wait(timeout=0)
+            except subprocess.TimeoutExpired:
+                raise TimeoutError()
+            return
     try:
         process.wait(timeout=timeout)
     except TimeoutError:
@@ -117,39 +270,113 @@ def _wait_for_process(process: subprocess.Popen, timeout: float) -> None:
         raise TimeoutError()
 
 
-def stop_client(client: Dict[str, object]) -> bool:
+def _kill_process(process: subprocess.Popen) -> None:
+    """Forcefully kill a child that ignored terminate and release its pipes."""
+    kill = getattr(process, "kill", None)
+    if callable(kill):
+        try:
+            kill()
+            _wait_for_process(process, 1.0)
+        except TimeoutError:
+            LOGGER.warning("Process did not exit after kill")
+        except Exception:
+            LOGGER.warning("Failed to kill process", exc_info=True)
+    for stream_name in ("stdin", "stdout", "stderr"):
+        stream = getattr(process, stream_name, None)
+        if stream is not None and hasattr(stream, "close"):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+def stop_client(client: MCPClient) -> bool:
     """Stop the MCP server subprocess if it is running."""
-    process = client.get("process")
+    process = client.process
     if process is None:
         LOGGER.debug("Stop requested but no active process")
         return False
-    timeout = float(client.get("timeout", DEFAULT_TIMEOUT_SECONDS))
+    timeout = float(client.timeout)
     try:
         LOGGER.info("Terminating MCP server process")
         process.terminate()
     except Exception:
         LOGGER.warning("Failed to terminate process cleanly", exc_info=True)
-        client["process"] = None
+        client.process = None
         return True
     try:
         _wait_for_process(process, timeout)
     except TimeoutError:
         LOGGER.warning("Process did not exit before timeout", extra={"timeout": timeout})
-        client["process"] = None
+        _kill_process(process)
+        client.process = None
         return True
-    client["process"] = None
+    client.process = None
     return True
 
 
-def create_request_id_generator():
-    """Return a callable that generates unique JSON-RPC request identifiers."""
-    state = {"value": 0}
+def create_client_pool(config: Dict[str, object], size: int = 2) -> Dict[str, object]:
+    """Create a pool of pre-started clients to amortize Node startup cost.
+
+    Args:
+        config: Client configuration passed to ``create_client``.
+        size: Number of clients to warm up front.
+
+    Returns:
+        A pool dictionary with a queue of started clients.
+    """
+    if size <= 0:
+        raise ValueError("Pool size must be positive")
+    clients: "queue.Queue[MCPClient]" = queue.Queue()
+    for _ in range(size):
+        client = create_client(config)
+        start_client(client)
+        clients.put(client)
+    pool: Dict[str, object] = {"clients": clients, "size": size, "closed": False}
+    return pool
+
+
+def acquire_client(pool: Dict[str, object], timeout: Optional[float] = None) -> MCPClient:
+    """Check a warm client out of the pool.
+
+    Blocks until a client is released when ``timeout`` is ``None``;
+    otherwise waits up to ``timeout`` seconds and raises RuntimeError if
+    none becomes available.
+    """
+    if pool.get("closed"):
+        raise RuntimeError("Client pool is closed")
+    clients = pool["clients"]
+    try:
+        if timeout is None:
+            return clients.get()
+        return clients.get(timeout=timeout)
+    except queue.Empty:
+        raise RuntimeError("No client available in pool") from None
+
+
+def release_client(pool: Dict[str, object], client: MCPClient) -> None:
+    """Return a client to the pool instead of terminating its subprocess."""
+    if pool.get("closed"):
+        stop_client(client)
+        return
+    pool["clients"].put(client)
+
+
+def close_pool(pool: Dict[str, object]) -> None:
+    """Stop every pooled client and mark the pool closed."""
+    pool["closed"] = True
+    clients = pool["clients"]
+    while True:
+        try:
+            client = clients.get_nowait()
+        except queue.Empty:
+            break
+        stop_client(client)
 
-    def _next_id():
-        state["value"] += 1
-        return str(state["value"])
 
-    return _next_id
+def create_request_id_generator():
+    """Return a callable that generates unique JSON-RPC request identifiers."""
+    return map(str, itertools.count(1)).__next__
 
 
 def build_json_rpc_request(method: str, params: Dict[str, object], generator) -> Dict[str, object]:
@@ -166,66 +393,159 @@ def build_json_rpc_request(method: str, params: Dict[str, object], generator) ->
     return request
 
 
-def send_json_rpc_request(client: Dict[str, object], request: Dict[str, object]) -> None:
+def send_json_rpc_request(client: MCPClient, request: Dict[str, object]) -> None:
     """Serialize and send a JSON-RPC request via the client's subprocess stdin."""
-    process = client.get("process")
+    process = client.process
     if process is None or not hasattr(process, "stdin"):
         raise RuntimeError("MCP client process is not running")
     LOGGER.debug(
         "Sending JSON-RPC request",
         extra={"method": request.get("method"), "id": request.get("id")},
     )
-    serialized = dumps_json(request) + "\n"
+    if client.wire_format == "msgpack":
+        packed = msgpack.packb(request)
+        process.stdin.write(struct.pack(">I", len(packed)) + packed)
+        process.stdin.flush()
+        return
+    serialized = dumps_json_compact(request) + b"\n"
     process.stdin.write(serialized)
     process.stdin.flush()
 
 
-def read_json_rpc_response(client: Dict[str, object]) -> Dict[str, object]:
-    """Read and deserialize a JSON-RPC response from the client's subprocess stdout."""
-    process = client.get("process")
+def _read_exact(stream, size: int, timeout: float) -> bytes:
+    """Read exactly ``size`` bytes from a binary stream, honoring the timeout.
+
+    When the stream exposes a descriptor, bytes are drained with ``os.read``
+    after each ``select`` so a stalled peer cannot block past the timeout
+    the way ``BufferedReader.read(n)`` would.
+    """
+    chunks = []
+    remaining = size
+    fd = None
+    if hasattr(stream, "fileno"):
+        try:
+            fd = stream.fileno()
+        except (OSError, ValueError):
+            fd = None
+    while remaining > 0:
+        if fd is not None:
+            readable, _, _ = select.select([fd], [], [], timeout)
+            if not readable:
+                raise TimeoutError()
+            chunk = os.read(fd, remaining)
+        else:
+            chunk = stream.read(remaining)
+        if not chunk:
+            raise RuntimeError("No response received from MCP server")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _read_msgpack_payload(client: MCPClient) -> object:
+    """Read one length-prefixed msgpack payload from the subprocess stdout."""
+    process = client.process
+    if process is None or not hasattr(process, "stdout"):
+        raise RuntimeError("MCP client process is not running")
+    timeout = float(client.timeout)
+    header = _read_exact(process.stdout, 4, timeout)
+    (length,) = struct.unpack(">I", header)
+    packed = _read_exact(process.stdout, length, timeout)
+    return msgpack.unpackb(packed)
+
+
+def _read_line_buffered(client: MCPClient, stream, timeout: float) -> bytes:
+    """Read one newline-terminated frame using 64 KiB chunked reads.
+
+    Large responses arrive in a few big ``os.read`` calls instead of the
+    byte-at-a-time scanning done by the io layer's ``readline``; any bytes
+    past the newline are kept in the client's receive buffer for the next
+    response.
+    """
+    buffer = client._rx_buffer
+    while True:
+        newline_index = buffer.find(b"\n")
+        if newline_index >= 0:
+            line = bytes(buffer[: newline_index + 1])
+            del buffer[: newline_index + 1]
+            return line
+        readable, _, _ = select.select([stream], [], [], timeout)
+        if not readable:
+            raise TimeoutError()
+        chunk = os.read(stream.fileno(), 65536)
+        if not chunk:
+            if buffer:
+                line = bytes(buffer)
+                buffer.clear()
+                return line
+            return b""
+        buffer.extend(chunk)
+
+
+def _read_json_rpc_payload(client: MCPClient) -> object:
+    """Read and deserialize one JSON-RPC payload from the subprocess stdout."""
+    if client.wire_format == "msgpack":
+        return _read_msgpack_payload(client)
+    process = client.process
     if process is None or not hasattr(process, "stdout"):
         raise RuntimeError("MCP client process is not running")
-    timeout = float(client.get("timeout", DEFAULT_TIMEOUT_SECONDS))
+    timeout = float(client.timeout)
+    stream = process.stdout
+    use_buffered = False
+    if hasattr(stream, "fileno"):
+        try:
+            stream.fileno()
+            use_buffered = True
+        except (OSError, ValueError):
+            use_buffered = False
     while True:
-        line = _readline_with_timeout(process.stdout, timeout)
-        if line == "":
+        if use_buffered:
+            line = _read_line_buffered(client, stream, timeout)
+        else:
+            line = _readline_with_timeout(stream, timeout)
+        if not line:
             raise RuntimeError("No response received from MCP server")
         stripped = line.strip()
         if stripped:
+            terminator = stripped[-1:]
+            if terminator not in ("}", "]", b"}", b"]"):
+                LOGGER.error("Failed to decode MCP response", extra={"payload": stripped})
+                raise RuntimeError("Invalid JSON-RPC response format")
             try:
-                response = json.loads(stripped)
-            except json.JSONDecodeError as error:
+                return _LOADS(stripped)
+            except ValueError as error:
                 LOGGER.error("Failed to decode MCP response", extra={"payload": stripped})
                 raise RuntimeError("Invalid JSON-RPC response format") from error
-            if not isinstance(response, dict):
-                raise RuntimeError("Invalid JSON-RPC response format")
-            LOGGER.debug(
-                "Received JSON-RPC response",
-                extra={"keys": list(response.keys())},
-            )
-            return response
 
 
-def _get_or_create_request_id_generator(client: Dict[str, object]):
-    generator = client.get("_request_id_generator")
+def read_json_rpc_response(client: MCPClient) -> Dict[str, object]:
+    """Read and deserialize a JSON-RPC response from the client's subprocess stdout."""
+    response = _read_json_rpc_payload(client)
+    if not isinstance(response, dict):
+        raise RuntimeError("Invalid JSON-RPC response format")
+    LOGGER.debug(
+        "Received JSON-RPC response",
+        extra={"keys": list(response.keys())},
+    )
+    return response
+
+
+def _get_or_create_request_id_generator(client: MCPClient):
+    generator = client._request_id_generator
     if generator is None:
         generator = create_request_id_generator()
-        client["_request_id_generator"] = generator
+        client._request_id_generator = generator
     return generator
 
 
-def invoke_tool(client: Dict[str, object], method: str, params: Dict[str, object]) -> Dict[str, object]:
-    """Send a JSON-RPC request and return the result field from the response."""
-    generator = _get_or_create_request_id_generator(client)
-    request = build_json_rpc_request(method, params, generator)
-    send_json_rpc_request(client, request)
-    response = read_json_rpc_response(client)
+def _extract_rpc_result(response: Dict[str, object]) -> Dict[str, object]:
+    """Validate a JSON-RPC response and normalize its result field."""
     if "error" in response:
         error = response["error"]
         message = "MCP server returned an error"
         if isinstance(error, dict) and "message" in error:
             message = str(error.get("message"))
-        LOGGER.error("MCP server returned error", extra={"message": message})
+        LOGGER.error("MCP server returned error", extra={"error_message": message})
         raise RuntimeError(message)
     result = response.get("result")
     if result is None:
@@ -240,6 +560,130 @@ def invoke_tool(client: Dict[str, object], method: str, params: Dict[str, object
     return {"value": result}
 
 
+def invoke_tool(client: MCPClient, method: str, params: Dict[str, object]) -> Dict[str, object]:
+    """Send a JSON-RPC request and return the result field from the response."""
+    generator = _get_or_create_request_id_generator(client)
+    if client.wire_format == "msgpack":
+        request = build_json_rpc_request(method, params, generator)
+        send_json_rpc_request(client, request)
+    else:
+        process = client.process
+        if process is None or not hasattr(process, "stdin"):
+            raise RuntimeError("MCP client process is not running")
+        frame = _serialize_request_frame(method, params, generator())
+        process.stdin.write(frame)
+        process.stdin.flush()
+    response = read_json_rpc_response(client)
+    return _extract_rpc_result(response)
+
+
+def invoke_tools_batch(client: MCPClient, calls: List[Tuple[str, Dict[str, object]]]) -> List[Dict[str, object]]:
+    """Send several JSON-RPC requests as one array and return results in order.
+
+    JSON-RPC 2.0 permits array-batched requests; collapsing N calls into a
+    single stdin write and a single stdout parse amortizes the per-call
+    framing and round-trip overhead.
+    """
+    if not calls:
+        return []
+    generator = _get_or_create_request_id_generator(client)
+    requests: List[Dict[str, object]] = []
+    for method, params in calls:
+        requests.append(build_json_rpc_request(method, params, generator))
+    process = client.process
+    if process is None or not hasattr(process, "stdin"):
+        raise RuntimeError("MCP client process is not running")
+    serialized = dumps_json_compact(requests) + b"\n"
+    process.stdin.write(serialized)
+    process.stdin.flush()
+    payload = _read_json_rpc_payload(client)
+    if not isinstance(payload, list):
+        raise RuntimeError("Invalid JSON-RPC batch response format")
+    responses_by_id: Dict[object, Dict[str, object]] = {}
+    for item in payload:
+        if isinstance(item, dict):
+            responses_by_id[item.get("id")] = item
+    results: List[Dict[str, object]] = []
+    for request in requests:
+        response = responses_by_id.get(request["id"])
+        if response is None:
+            raise RuntimeError("Batch response missing entry for request")
+        results.append(_extract_rpc_result(response))
+    return results
+
+
+def send_json_rpc_requests(client: MCPClient, requests: List[Dict[str, object]]) -> None:
+    """Send several serialized JSON-RPC requests with one vectored write.
+
+    ``os.writev`` submits every frame in a single syscall when the stdin
+    pipe exposes a file descriptor; stub or non-descriptor streams fall
+    back to one coalesced ``write``.
+    """
+    if not requests:
+        return
+    process = client.process
+    if process is None or not hasattr(process, "stdin"):
+        raise RuntimeError("MCP client process is not running")
+    frames: List[bytes] = []
+    for request in requests:
+        frames.append(dumps_json_compact(request) + b"\n")
+    stdin = process.stdin
+    if hasattr(os, "writev") and hasattr(stdin, "fileno"):
+        try:
+            fd = stdin.fileno()
+        except (OSError, ValueError):
+            fd = None
+        if fd is not None:
+            if hasattr(stdin, "flush"):
+                stdin.flush()
+            total = 0
+            for frame in frames:
+                total += len(frame)
+            written = os.writev(fd, frames)
+            if written < total:
+                payload = memoryview(b"".join(frames))
+                while written < total:
+                    written += os.write(fd, payload[written:])
+            return
+    stdin.write(b"".join(frames))
+    stdin.flush()
+
+
+def invoke_tools_pipelined(client: MCPClient, calls: List[Tuple[str, Dict[str, object]]]) -> List[Dict[str, object]]:
+    """Send several JSON-RPC requests back-to-back before reading any response.
+
+    JSON-RPC 2.0 allows interleaved responses matched by ``id``, so N
+    independent calls cost roughly one round-trip instead of N without
+    requiring server-side batch support. Requests go out in bounded
+    chunks, with each chunk's responses drained before the next is
+    written, so a large burst cannot deadlock on full pipe buffers.
+    """
+    if not calls:
+        return []
+    generator = _get_or_create_request_id_generator(client)
+    requests: List[Dict[str, object]] = []
+    for method, params in calls:
+        requests.append(build_json_rpc_request(method, params, generator))
+    responses_by_id: Dict[object, Dict[str, object]] = {}
+    for start in range(0, len(requests), _PIPELINE_CHUNK):
+        chunk = requests[start : start + _PIPELINE_CHUNK]
+        if client.wire_format == "msgpack":
+            for request in chunk:
+                send_json_rpc_request(client, request)
+        else:
+            send_json_rpc_requests(client, chunk)
+        for _ in chunk:
+            response = read_json_rpc_response(client)
+            responses_by_id[response.get("id")] = response
+    results: List[Dict[str, object]] = []
+    for request in requests:
+        response = responses_by_id.get(request["id"])
+        if response is None:
+            raise RuntimeError("Pipelined response missing entry for request")
+        results.append(_extract_rpc_result(response))
+    return results
+
+
 def _readline_with_timeout(stream, timeout: float) -> str:
     """Read a line from stream, respecting timeout when possible."""
     if timeout is None:
@@ -260,29 +704,39 @@ def _readline_with_timeout(stream, timeout: float) -> str:
     return stream.readline()
 
 
-def use_client(client: Dict[str, object]):
-    """Return a context manager that manages MCP client lifecycle."""
-    state = {"entered": False, "started": False}
+class _ClientContext:
+    """Context manager driving the MCP client lifecycle."""
+
+    __slots__ = ("_client", "_entered", "_started")
 
-    def __enter__(self):
-        if state["entered"]:
+    def __init__(self, client: MCPClient) -> None:
+        self._client = client
+        self._entered = False
+        self._started = False
+
+    def __enter__(self) -> MCPClient:
+        if self._entered:
             raise RuntimeError("Client context already in use")
-        active = int(client.get("active_contexts", 0))
+        client = self._client
+        active = int(client.active_contexts)
         if active > 0:
             raise RuntimeError("Client context already active")
-        state["entered"] = True
-        client["active_contexts"] = active + 1
+        self._entered = True
+        client.active_contexts = active + 1
         start_client(client)
-        state["started"] = True
+        self._started = True
         return client
 
-    def __exit__(self, exc_type, exc, exc_tb):
-        if state["started"]:
+    def __exit__(self, exc_type, exc, exc_tb) -> bool:
+        client = self._client
+        if self._started:
             stop_client(client)
-            state["started"] = False
-        client["active_contexts"] = 0
-        state["entered"] = False
+            self._started = False
+        client.active_contexts = 0
+        self._entered = False
         return False
 
-    context_type = type("_ClientContext", (), {"__enter__": __enter__, "__exit__": __exit__})
-    return context_type()
+
+def use_client(client: MCPClient) -> _ClientContext:
+    """Return a context manager that manages MCP client lifecycle."""
+    return _ClientContext(client)
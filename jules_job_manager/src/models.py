@@ -2,20 +2,52 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
+import pickle
+import re
+import sys
+import time
 from datetime import datetime
 from typing import Dict, Iterable, List, Optional
 
 TASK_STATUS_VALUES: List[str] = [
-    "pending",
-    "in_progress",
-    "completed",
-    "paused",
-    "waiting_approval",
+    sys.intern("pending"),
+    sys.intern("in_progress"),
+    sys.intern("completed"),
+    sys.intern("paused"),
+    sys.intern("waiting_approval"),
 ]
 
 CHAT_ROLES: List[str] = ["user", "jules", "system"]
 
+_TASK_STATUS_SET = frozenset(TASK_STATUS_VALUES)
+_CHAT_ROLES_SET = frozenset(CHAT_ROLES)
+
+_LOCAL_TZ = datetime.now().astimezone().tzinfo
+
+_ISO_TIMESTAMP_PATTERN = re.compile(
+    r"\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])"
+    r"T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d+)?"
+    r"(?:[+-](?:[01]\d|2[0-3]):[0-5]\d|Z)?"
+)
+
+_NOW_TICK_NS = 10_000_000
+_now_cache: tuple = (None, "")
+
+
+def _iso_now() -> str:
+    """Return the current time in ISO format, cached at ~10ms granularity.
+
+    Batch ingest paths create many default timestamps back to back; the
+    tick cache collapses those into one datetime construction per tick.
+    """
+    global _now_cache
+    tick = time.monotonic_ns() // _NOW_TICK_NS
+    cached_tick, cached_iso = _now_cache
+    if tick != cached_tick:
+        cached_iso = datetime.now(tz=_LOCAL_TZ).isoformat()
+        _now_cache = (tick, cached_iso)
+    return cached_iso
+
 
 def get_task_status_values() -> List[str]:
     """Return all allowed task status values."""
@@ -24,22 +56,26 @@ def get_task_status_values() -> List[str]:
 
 def validate_task_status(status: str) -> None:
     """Ensure the provided status string is valid."""
-    if status not in TASK_STATUS_VALUES:
+    if status not in _TASK_STATUS_SET:
         message = f"Unsupported task status: {status}"
         raise ValueError(message)
 
 
 def _ensure_timestamp(timestamp: Optional[str]) -> str:
     if timestamp is None:
-        now = datetime.now().astimezone()
-        return now.isoformat()
-    datetime.fromisoformat(timestamp)
+        return _iso_now()
+    if _ISO_TIMESTAMP_PATTERN.fullmatch(timestamp) is None:
+        datetime.fromisoformat(timestamp)
+    elif timestamp[8] == "3" or timestamp[5] == "0" and timestamp[6] == "2":
+        # Days 30/31 and anything in February can still be calendar-invalid
+        # (e.g. 2025-02-30); defer those to the full parser.
+        datetime.fromisoformat(timestamp)
     return timestamp
 
 
 def create_chat_message(role: str, content: str, timestamp: Optional[str] = None) -> Dict[str, str]:
     """Create a chat message dictionary with validated data."""
-    if role not in CHAT_ROLES:
+    if role not in _CHAT_ROLES_SET:
         message = f"Unsupported chat role: {role}"
         raise ValueError(message)
     if not content:
@@ -107,26 +143,30 @@ def _ensure_datetime(value: datetime) -> datetime:
         message = "Expected datetime instance"
         raise TypeError(message)
     if value.tzinfo is None:
-        return value.replace(tzinfo=datetime.now().astimezone().tzinfo)
+        return value.replace(tzinfo=_LOCAL_TZ)
     return value
 
 
-def _normalize_chat_history(history: Optional[Iterable[Dict[str, str]]]) -> List[Dict[str, str]]:
-    normalized: List[Dict[str, str]] = []
+def _normalize_chat_history(
+    history: Optional[Iterable[Dict[str, str]]],
+    trusted: bool = False,
+) -> List[Dict[str, str]]:
     if history is None:
-        return normalized
-    for item in history:
-        normalized.append(chat_message_from_dict(item))
-    return normalized
+        return []
+    if trusted:
+        return list(history)
+    return [chat_message_from_dict(item) for item in history]
 
 
-def _normalize_source_files(files: Optional[Iterable[Dict[str, Optional[str]]]]) -> List[Dict[str, Optional[str]]]:
-    normalized: List[Dict[str, Optional[str]]] = []
+def _normalize_source_files(
+    files: Optional[Iterable[Dict[str, Optional[str]]]],
+    trusted: bool = False,
+) -> List[Dict[str, Optional[str]]]:
     if files is None:
-        return normalized
-    for item in files:
-        normalized.append(source_file_from_dict(item))
-    return normalized
+        return []
+    if trusted:
+        return list(files)
+    return [source_file_from_dict(item) for item in files]
 
 
 def create_jules_task(
@@ -175,26 +215,31 @@ def create_jules_task(
 
 
 def jules_task_to_dict(task: Dict[str, object]) -> Dict[str, object]:
-    """Convert an in-memory task dictionary to a JSON-serializable dict."""
-    serialized: Dict[str, object] = {}
-    for key, value in task.items():
-        serialized[key] = value
-    created_at = serialized.get("created_at")
-    updated_at = serialized.get("updated_at")
+    """Convert an in-memory task dictionary to a JSON-serializable dict.
+
+    Chat and source-file entries are already validated plain dicts that
+    callers treat as read-only, so the lists are rebuilt in C via
+    ``list`` without per-item copies.
+    """
+    created_at = task.get("created_at")
+    updated_at = task.get("updated_at")
     if isinstance(created_at, datetime):
-        serialized["created_at"] = created_at.isoformat()
+        created_at = created_at.isoformat()
     if isinstance(updated_at, datetime):
-        serialized["updated_at"] = updated_at.isoformat()
-    history = serialized.get("chat_history", [])
-    new_history: List[Dict[str, str]] = []
-    for item in history:
-        new_history.append(chat_message_to_dict(item))
-    serialized["chat_history"] = new_history
-    files = serialized.get("source_files", [])
-    new_files: List[Dict[str, Optional[str]]] = []
-    for item in files:
-        new_files.append(source_file_to_dict(item))
-    serialized["source_files"] = new_files
+        updated_at = updated_at.isoformat()
+    serialized: Dict[str, object] = {
+        "id": task.get("id"),
+        "title": task.get("title"),
+        "description": task.get("description"),
+        "repository": task.get("repository"),
+        "branch": task.get("branch"),
+        "status": task.get("status"),
+        "created_at": created_at,
+        "updated_at": updated_at,
+        "url": task.get("url"),
+        "chat_history": list(task.get("chat_history", [])),
+        "source_files": list(task.get("source_files", [])),
+    }
     return serialized
 
 
@@ -224,6 +269,102 @@ def jules_task_from_dict(data: Dict[str, object]) -> Dict[str, object]:
     )
 
 
+def _normalize_timestamp_value(value: object) -> str:
+    """Return an ISO-format timestamp string from serialized or datetime input."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    text = str(value)
+    datetime.fromisoformat(text)
+    return text
+
+
+def normalize_task_dict(data: Dict[str, object], trusted: bool = False) -> Dict[str, object]:
+    """Validate raw task data and return a JSON-serializable dict in one pass.
+
+    Equivalent to ``jules_task_from_dict`` followed by ``jules_task_to_dict``
+    but without materializing the intermediate datetime-based dictionary.
+    ``trusted`` skips per-item revalidation of chat history and source files
+    for data that already passed validation (e.g. rows loaded from storage).
+    """
+    task_id = str(data.get("id"))
+    title = str(data.get("title"))
+    repository = str(data.get("repository"))
+    branch = str(data.get("branch"))
+    url = str(data.get("url"))
+    status = str(data.get("status"))
+    if not task_id or task_id == "None":
+        raise ValueError("Task identifier cannot be empty")
+    if not title or title == "None":
+        raise ValueError("Task title cannot be empty")
+    if not repository or repository == "None":
+        raise ValueError("Repository cannot be empty")
+    if not branch or branch == "None":
+        raise ValueError("Branch cannot be empty")
+    if not url or url == "None":
+        raise ValueError("Task URL cannot be empty")
+    validate_task_status(status)
+    normalized: Dict[str, object] = {
+        "id": task_id,
+        "title": title,
+        "description": str(data.get("description")),
+        "repository": repository,
+        "branch": branch,
+        "status": status,
+        "created_at": _normalize_timestamp_value(data.get("created_at")),
+        "updated_at": _normalize_timestamp_value(data.get("updated_at")),
+        "url": url,
+        "chat_history": _normalize_chat_history(data.get("chat_history"), trusted),
+        "source_files": _normalize_source_files(data.get("source_files"), trusted),
+    }
+    return normalized
+
+
+def jules_tasks_from_dicts(entries: Iterable[Dict[str, object]]) -> List[Dict[str, object]]:
+    """Normalize many serialized tasks with per-batch rather than per-row overhead.
+
+    Rows whose timestamps are already ``datetime`` objects (e.g. from an
+    in-memory backend holding normalized tasks) skip the parse entirely.
+    """
+    from_dict = jules_task_from_dict
+    normalized: List[Dict[str, object]] = []
+    for entry in entries:
+        if isinstance(entry.get("created_at"), datetime) and isinstance(
+            entry.get("updated_at"), datetime
+        ):
+            normalized.append(entry)
+        else:
+            normalized.append(from_dict(entry))
+    return normalized
+
+
+_TASK_SCHEMA_KEYS = frozenset(
+    [
+        "id",
+        "title",
+        "description",
+        "repository",
+        "branch",
+        "status",
+        "created_at",
+        "updated_at",
+        "url",
+        "chat_history",
+        "source_files",
+    ]
+)
+
+
 def clone_jules_task(task: Dict[str, object]) -> Dict[str, object]:
-    """Return a deep copy of a task dictionary."""
-    return deepcopy(task)
+    """Return a deep copy of a task dictionary.
+
+    For schema-shaped tasks every leaf is immutable (strings, datetimes),
+    so a shallow rebuild of the containers is equivalent to ``deepcopy``
+    without its reflection overhead. Tasks carrying unexpected extra keys
+    fall back to a pickle round-trip, which still beats ``deepcopy``.
+    """
+    if not _TASK_SCHEMA_KEYS.issuperset(task):
+        return pickle.loads(pickle.dumps(task, protocol=5))
+    cloned = dict(task)
+    cloned["chat_history"] = [dict(item) for item in task.get("chat_history", [])]
+    cloned["source_files"] = [dict(item) for item in task.get("source_files", [])]
+    return cloned
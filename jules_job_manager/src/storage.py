@@ -3,9 +3,34 @@
 from __future__ import annotations
 
 import json
+import mmap
 import os
+import threading
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+_CREATED_AT_GETTER = itemgetter("created_at")
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+if orjson is not None:
+    _LOADS = orjson.loads
+else:
+    _LOADS = json.loads
+
+
+def _sid(value: object) -> str:
+    """Return the value as a str, skipping conversion when it already is one."""
+    return value if type(value) is str else str(value)
 
 
 def _ensure_parent_directory(file_path: str) -> None:
@@ -15,46 +40,117 @@ def _ensure_parent_directory(file_path: str) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def _starts_with_object(head: bytes) -> bool:
+    """Cheaply check that content opens a JSON object before full parsing."""
+    for byte in head:
+        if byte in b" \t\r\n":
+            continue
+        return byte == 0x7B
+    return False
+
+
 def _load_raw_data(file_path: str) -> Dict[str, Dict[str, object]]:
-    """Load all task data from disk, returning an empty dict on failure."""
-    if not os.path.exists(file_path):
-        return {}
+    """Load all task data from disk, returning an empty dict on failure.
+
+    A one-byte sniff rejects files that cannot possibly hold the task
+    mapping without scanning the whole payload. With orjson installed the
+    file is then memory-mapped and parsed without an intermediate bytes
+    copy; the stdlib path reads normally.
+    """
     try:
-        with open(file_path, "r", encoding="utf-8") as handle:
-            contents = handle.read().strip()
-            if not contents:
-                return {}
-            data = json.loads(contents)
-            if not isinstance(data, dict):
-                return {}
-            return {str(key): value for key, value in data.items() if isinstance(value, dict)}
-    except json.JSONDecodeError:
+        if orjson is not None:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                if size == 0:
+                    return {}
+                buffer = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+                try:
+                    if not _starts_with_object(buffer[:16]):
+                        return {}
+                    view = memoryview(buffer)
+                    try:
+                        data = _LOADS(view)
+                    finally:
+                        view.release()
+                finally:
+                    buffer.close()
+            finally:
+                os.close(fd)
+        else:
+            with open(file_path, "rb") as handle:
+                contents = handle.read().strip()
+                if not contents:
+                    return {}
+                if not _starts_with_object(contents[:16]):
+                    return {}
+                data = _LOADS(contents)
+        if not isinstance(data, dict):
+            return {}
+        return {_sid(key): value for key, value in data.items() if isinstance(value, dict)}
+    except FileNotFoundError:
         return {}
+    except ValueError:
+        return {}
+
+
+def _serialize_data(data: Dict[str, Dict[str, object]]) -> bytes:
+    """Serialize task data to normalized JSON bytes.
 
+    orjson sorts keys in C; the stdlib fallback pre-sorts the outer task
+    mapping once in Python so the encoder runs a single pass without its
+    per-level key sorting.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    ordered = dict(sorted(data.items()))
+    return json.dumps(ordered, indent=2, separators=(",", ": ")).encode("utf-8")
 
-def _serialize_data(data: Dict[str, Dict[str, object]]) -> str:
-    """Serialize task data to a normalized JSON string."""
-    return json.dumps(data, indent=2, sort_keys=True)
 
+def _save_raw_data(
+    file_path: str,
+    data: Dict[str, Dict[str, object]],
+    serialized: bytes,
+    temp_path: Optional[str] = None,
+) -> None:
+    """Persist task data to disk durably using atomic replace.
 
-def _save_raw_data(file_path: str, data: Dict[str, Dict[str, object]], serialized: str) -> None:
-    """Persist task data to disk with stable formatting using atomic replace."""
+    The temp file is written and fsynced through raw descriptors, and the
+    parent directory is fsynced after the rename so the replace survives
+    a crash.
+    """
     _ensure_parent_directory(file_path)
-    temp_path = Path(file_path).with_suffix(".tmp")
-    with open(temp_path, "w", encoding="utf-8") as handle:
-        handle.write(serialized)
+    if temp_path is None:
+        temp_path = str(Path(file_path).with_suffix(".tmp"))
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(serialized)
+        written = 0
+        while written < len(serialized):
+            written += os.write(fd, view[written:])
+        os.fsync(fd)
+    finally:
+        os.close(fd)
     os.replace(temp_path, file_path)
+    directory = os.path.dirname(file_path) or "."
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
 
+def _shallow_copy_tasks(data: Dict[str, Dict[str, object]]) -> Dict[str, Dict[str, object]]:
+    """Return a copy-on-write style clone sharing the task values.
 
-def _copy_dict_of_dicts(data: Dict[str, Dict[str, object]]) -> Dict[str, Dict[str, object]]:
-    """Return a deep-ish copy of a nested dictionary without comprehensions."""
-    cloned: Dict[str, Dict[str, object]] = {}
-    for key, value in data.items():
-        inner: Dict[str, object] = {}
-        for inner_key, inner_value in value.items():
-            inner[inner_key] = inner_value
-        cloned[str(key)] = inner
-    return cloned
+    Mutation paths only rebind or remove whole task entries and treat the
+    values themselves as read-only, so sharing them with the cache is safe
+    and skips the per-task copies entirely.
+    """
+    return dict(data)
 
 
 def create_storage(file_path: str) -> Dict[str, object]:
@@ -63,124 +159,486 @@ def create_storage(file_path: str) -> Dict[str, object]:
     if not os.path.exists(file_path):
         with open(file_path, "w", encoding="utf-8") as handle:
             handle.write("{}")
+    path = Path(file_path)
+    lock_path = str(path.with_suffix(".lock"))
+    lock_fd = os.open(lock_path, os.O_CREAT | os.O_RDWR, 0o644)
     manager = {
         "file_path": file_path,
-        "lock": Path(file_path).with_suffix(".lock"),
+        "log_path": str(path.with_suffix(".log")),
+        "temp_path": str(path.with_suffix(".tmp")),
+        "lock_path": lock_path,
+        "lock_fd": lock_fd,
+        "thread_lock": threading.Lock(),
         "cache": None,
-        "cache_mtime": None,
+        "cache_ident": None,
         "cache_serialized": None,
     }
     return manager
 
 
+def create_in_memory_storage() -> Dict[str, object]:
+    """Create a storage manager that keeps tasks purely in memory.
+
+    Satisfies the same save/get/list/delete contract as the file-backed
+    manager but skips disk, locking, and the append-only log entirely.
+    Useful for tests and ephemeral workflows.
+    """
+    manager = {
+        "file_path": None,
+        "log_path": None,
+        "temp_path": None,
+        "lock_path": None,
+        "lock_fd": None,
+        "memory": True,
+        "thread_lock": threading.Lock(),
+        "cache": {},
+        "cache_ident": None,
+        "cache_serialized": None,
+        "by_status": {},
+    }
+    return manager
+
+
 def storage_path(manager: Dict[str, object]) -> str:
     """Return the file path associated with the storage manager."""
     return str(manager["file_path"])
 
 
+_FALLBACK_THREAD_LOCK = threading.Lock()
+
+
+def _thread_lock(manager: Dict[str, object]) -> threading.Lock:
+    """Return the manager's in-process write lock."""
+    lock = manager.get("thread_lock")
+    if lock is None:
+        lock = _FALLBACK_THREAD_LOCK
+    return lock
+
+
 def _acquire_lock(manager: Dict[str, object]) -> None:
-    """Create a simple lock file to coordinate writes."""
-    lock_file = manager["lock"]
-    if Path(lock_file).exists():
-        return
-    Path(lock_file).touch()
+    """Take the in-process lock, then a kernel advisory lock on the lock fd."""
+    _thread_lock(manager).acquire()
+    lock_fd = manager.get("lock_fd")
+    if fcntl is not None and lock_fd is not None:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
 
 
 def _release_lock(manager: Dict[str, object]) -> None:
-    """Remove the lock file if it exists."""
-    lock_file = manager["lock"]
-    path = Path(lock_file)
-    if path.exists():
-        path.unlink()
+    """Release the kernel advisory lock and the in-process lock."""
+    lock_fd = manager.get("lock_fd")
+    if fcntl is not None and lock_fd is not None:
+        fcntl.flock(lock_fd, fcntl.LOCK_UN)
+    _thread_lock(manager).release()
 
 
-def _load_all(manager: Dict[str, object]) -> Dict[str, Dict[str, object]]:
-    """Load all tasks from the manager's backing file."""
-    file_path = storage_path(manager)
-    current_mtime = None
-    if os.path.exists(file_path):
-        current_mtime = os.path.getmtime(file_path)
+def _stat_ident(file_path: str) -> Optional[Tuple[int, int]]:
+    """Return the file's freshness identity from a single stat call.
+
+    Nanosecond mtime plus size catches same-second overwrites that a float
+    mtime alone would miss.
+    """
+    try:
+        result = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return (result.st_mtime_ns, result.st_size)
+
+
+def _log_path(manager: Dict[str, object]) -> str:
+    """Return the append-only log path associated with the storage manager."""
+    return str(manager["log_path"])
+
+
+def _replay_log(data: Dict[str, Dict[str, object]], log_path: str) -> Dict[str, Dict[str, object]]:
+    """Apply logged put/del operations on top of the snapshot data."""
+    try:
+        with open(log_path, "rb") as handle:
+            for line in handle:
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                try:
+                    record = _LOADS(stripped)
+                except ValueError:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                operation = record.get("op")
+                if operation == "put" and isinstance(record.get("task"), dict):
+                    task = record["task"]
+                    data[_sid(task.get("id"))] = task
+                elif operation == "del":
+                    data.pop(_sid(record.get("id")), None)
+    except FileNotFoundError:
+        pass
+    return data
+
+
+def _encode_log_record(record: Dict[str, object]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, sort_keys=True).encode("utf-8") + b"\n"
+
+
+def _append_log_records(manager: Dict[str, object], records: List[Dict[str, object]]) -> None:
+    """Append mutation records to the log with a single write and fsync."""
+    if manager.get("memory"):
+        return
+    log_path = _log_path(manager)
+    payload = b"".join([_encode_log_record(record) for record in records])
+    with open(log_path, "ab") as handle:
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
+
+
+def _append_log(manager: Dict[str, object], record: Dict[str, object]) -> None:
+    """Append one mutation record to the log and force it to disk."""
+    _append_log_records(manager, [record])
+
+
+def _current_ident(manager: Dict[str, object]) -> Optional[Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]]:
+    """Return the combined snapshot+log freshness identity."""
+    if manager.get("memory"):
+        return None
+    return (_stat_ident(storage_path(manager)), _stat_ident(_log_path(manager)))
+
+
+def _build_status_index(data: Dict[str, Dict[str, object]]) -> Dict[str, set]:
+    """Build the status -> task-id index for O(1) filtered listings."""
+    index: Dict[str, set] = {}
+    for key, task in data.items():
+        status = task.get("status")
+        if status in index:
+            index[status].add(key)
+        else:
+            index[status] = {key}
+    return index
+
+
+def _load_all_readonly(manager: Dict[str, object]) -> Dict[str, Dict[str, object]]:
+    """Load all tasks for read-only use, returning the cache directly on hit.
+
+    Callers must not mutate the returned mapping or its values; mutation
+    paths copy via ``_shallow_copy_tasks`` first.
+    """
+    if manager.get("memory"):
+        return manager["cache"]
+    current_ident = _current_ident(manager)
     cached_data = manager.get("cache")
-    cached_mtime = manager.get("cache_mtime")
-    if cached_data is not None and cached_mtime == current_mtime:
-        return _copy_dict_of_dicts(cached_data)
-    data = _load_raw_data(file_path)
-    serialized = _serialize_data(data)
-    manager["cache"] = _copy_dict_of_dicts(data)
-    manager["cache_mtime"] = current_mtime
-    manager["cache_serialized"] = serialized
-    return _copy_dict_of_dicts(data)
+    if cached_data is not None and manager.get("cache_ident") == current_ident:
+        return cached_data
+    data = _load_raw_data(storage_path(manager))
+    _replay_log(data, _log_path(manager))
+    manager["cache"] = data
+    manager["cache_ident"] = current_ident
+    manager["by_status"] = _build_status_index(data)
+    return data
 
 
-def _save_all(manager: Dict[str, object], data: Dict[str, Dict[str, object]]) -> None:
-    """Save all tasks to the manager's backing file."""
+_COMPACT_MIN_LOG_BYTES = 65536
+
+
+def _compact_locked(manager: Dict[str, object]) -> None:
+    """Rewrite the snapshot and truncate the log; caller holds the lock."""
+    data = _shallow_copy_tasks(_load_all_readonly(manager))
     file_path = storage_path(manager)
     serialized = _serialize_data(data)
-    cached_serialized = manager.get("cache_serialized")
-    if cached_serialized is not None and cached_serialized == serialized:
-        manager["cache"] = _copy_dict_of_dicts(data)
-        return
-    existing = manager.get("cache")
-    if existing is not None:
-        same = True
-        for key, value in data.items():
-            if key not in existing or value != existing[key]:
-                same = False
-                break
-        if same and len(existing) == len(data):
-            manager["cache"] = _copy_dict_of_dicts(data)
-            manager["cache_serialized"] = serialized
-            return
-    _save_raw_data(file_path, data, serialized)
-    manager["cache"] = _copy_dict_of_dicts(data)
+    _save_raw_data(file_path, data, serialized, str(manager["temp_path"]))
+    log_path = _log_path(manager)
+    with open(log_path, "wb"):
+        pass
+    manager["cache"] = data
     manager["cache_serialized"] = serialized
-    if os.path.exists(file_path):
-        manager["cache_mtime"] = os.path.getmtime(file_path)
+    manager["cache_ident"] = _current_ident(manager)
+
+
+def compact(manager: Dict[str, object]) -> None:
+    """Rewrite the snapshot from current state and truncate the log."""
+    if manager.get("memory"):
+        return
+    _acquire_lock(manager)
+    try:
+        _compact_locked(manager)
+    finally:
+        _release_lock(manager)
+
+
+def _maybe_compact(manager: Dict[str, object]) -> None:
+    """Compact when the log has grown well past the snapshot size.
+
+    Caller must hold the storage lock.
+    """
+    if manager.get("memory"):
+        return
+    log_ident = _stat_ident(_log_path(manager))
+    if log_ident is None:
+        return
+    snapshot_ident = _stat_ident(storage_path(manager))
+    snapshot_size = snapshot_ident[1] if snapshot_ident is not None else 0
+    if log_ident[1] > max(4 * snapshot_size, _COMPACT_MIN_LOG_BYTES):
+        _compact_locked(manager)
+
+
+class StorageWriter:
+    """Write-behind buffer that coalesces task saves onto one worker thread.
+
+    Saves are last-write-wins per task identifier, so bursts of updates to
+    the same task collapse into a single disk write. ``flush`` blocks until
+    everything buffered so far has reached the backing store.
+    """
+
+    def __init__(self, manager: Dict[str, object]) -> None:
+        self._manager = manager
+        self._pending: Dict[str, Dict[str, object]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._drain_loop, daemon=True)
+        self._thread.start()
+
+    def _raise_pending_error(self) -> None:
+        with self._lock:
+            error = self._error
+            self._error = None
+        if error is not None:
+            raise RuntimeError("Write-behind save failed") from error
+
+    def save(self, task: Dict[str, object]) -> None:
+        """Buffer a task save for the background writer.
+
+        Raises:
+            RuntimeError: If the writer is closed, or a previous background
+                write failed (chained to the original error).
+        """
+        self._raise_pending_error()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("StorageWriter is closed")
+            self._pending[str(task["id"])] = task
+            self._idle.clear()
+            self._wakeup.set()
+
+    def _drain_loop(self) -> None:
+        while True:
+            self._wakeup.wait()
+            with self._lock:
+                batch = list(self._pending.values())
+                self._pending.clear()
+                self._wakeup.clear()
+                closed = self._closed
+            if batch:
+                try:
+                    save_tasks(self._manager, batch)
+                except BaseException as error:  # noqa: BLE001 - surfaced on flush/save
+                    with self._lock:
+                        self._error = error
+            with self._lock:
+                if not self._pending:
+                    self._idle.set()
+                    if closed:
+                        return
+
+    def flush(self) -> None:
+        """Block until all buffered saves have been written.
+
+        Raises:
+            RuntimeError: If a background write failed (chained to the
+                original error); the buffered batch that failed is lost.
+        """
+        self._idle.wait()
+        self._raise_pending_error()
+
+    def close(self) -> None:
+        """Flush remaining saves and stop the worker thread."""
+        with self._lock:
+            self._closed = True
+            self._wakeup.set()
+        self._thread.join(timeout=5)
 
 
 def save_task(manager: Dict[str, object], task: Dict[str, object]) -> None:
-    """Insert or update a task entry on disk."""
+    """Insert or update a task entry via the append-only log.
+
+    Each mutation appends one O(1) record instead of rewriting the whole
+    snapshot; the snapshot is rebuilt by ``compact`` once the log grows
+    past its threshold. Idempotent saves skip the log entirely.
+    """
+    _acquire_lock(manager)
+    try:
+        tasks = _load_all_readonly(manager)
+        key = _sid(task["id"])
+        if tasks.get(key) == task:
+            return
+        updated = _shallow_copy_tasks(tasks)
+        previous = updated.get(key)
+        updated[key] = task
+        _append_log(manager, {"op": "put", "task": task})
+        manager["cache"] = updated
+        manager["cache_ident"] = _current_ident(manager)
+        index = manager.get("by_status")
+        if index is not None:
+            # Replace the touched sets instead of mutating them so readers
+            # iterating a set they fetched earlier never see it resize.
+            if previous is not None:
+                previous_status = previous.get("status")
+                previous_ids = index.get(previous_status)
+                if previous_ids is not None:
+                    index[previous_status] = previous_ids - {key}
+            status = task.get("status")
+            current_ids = index.get(status)
+            index[status] = {key} if current_ids is None else current_ids | {key}
+        _maybe_compact(manager)
+    finally:
+        _release_lock(manager)
+
+
+def save_tasks(manager: Dict[str, object], tasks: List[Dict[str, object]]) -> None:
+    """Insert or update several tasks under one lock and one log write.
+
+    Coalescing N mutations into a single append and fsync amortizes the
+    per-write durability cost that ``save_task`` pays individually.
+    """
+    entries = list(tasks)
+    if not entries:
+        return
     _acquire_lock(manager)
     try:
-        tasks = _load_all(manager)
-        tasks[str(task["id"])] = task
-        _save_all(manager, tasks)
+        current = _load_all_readonly(manager)
+        changed: List[Tuple[str, Dict[str, object]]] = []
+        records: List[Dict[str, object]] = []
+        previous: Dict[str, Dict[str, object]] = {}
+        for task in entries:
+            key = _sid(task["id"])
+            if previous.get(key, current.get(key)) == task:
+                continue
+            previous[key] = task
+            changed.append((key, task))
+            records.append({"op": "put", "task": task})
+        if not records:
+            return
+        updated = _shallow_copy_tasks(current)
+        for key, task in changed:
+            updated[key] = task
+        _append_log_records(manager, records)
+        manager["cache"] = updated
+        manager["cache_ident"] = _current_ident(manager)
+        manager["by_status"] = _build_status_index(updated)
+        _maybe_compact(manager)
+    finally:
+        _release_lock(manager)
+
+
+def delete_tasks(manager: Dict[str, object], task_ids: List[str]) -> None:
+    """Remove several tasks under one lock, raising KeyError if any is missing."""
+    keys = [_sid(task_id) for task_id in task_ids]
+    if not keys:
+        return
+    _acquire_lock(manager)
+    try:
+        current = _load_all_readonly(manager)
+        for key in keys:
+            if key not in current:
+                raise KeyError(f"Task '{key}' not found")
+        updated = _shallow_copy_tasks(current)
+        records: List[Dict[str, object]] = []
+        for key in keys:
+            if key in updated:
+                del updated[key]
+                records.append({"op": "del", "id": key})
+        _append_log_records(manager, records)
+        manager["cache"] = updated
+        manager["cache_ident"] = _current_ident(manager)
+        manager["by_status"] = _build_status_index(updated)
+        _maybe_compact(manager)
     finally:
         _release_lock(manager)
 
 
 def get_task(manager: Dict[str, object], task_id: str) -> Dict[str, object]:
-    """Return a task by identifier, raising KeyError when missing."""
-    tasks = _load_all(manager)
-    key = str(task_id)
-    if key not in tasks:
-        raise KeyError(f"Task '{task_id}' not found")
-    return tasks[key]
+    """Return a task by identifier, raising KeyError when missing.
+
+    The returned dictionary is the cached parsed object, handed back by
+    reference with zero copies; callers must treat it as read-only.
+    """
+    tasks = _load_all_readonly(manager)
+    try:
+        return tasks[_sid(task_id)]
+    except KeyError:
+        raise KeyError(f"Task '{task_id}' not found") from None
 
 
 def list_tasks(manager: Dict[str, object], status: Optional[str] = None) -> List[Dict[str, object]]:
-    """Return all tasks, optionally filtered by status and sorted by creation time."""
-    tasks = _load_all(manager)
-    results = list(tasks.values())
-    if status is not None:
-        filtered: List[Dict[str, object]] = []
-        for entry in results:
-            if entry.get("status") == status:
-                filtered.append(entry)
-        results = filtered
-    results.sort(key=lambda task: task.get("created_at", ""))
+    """Return all tasks, optionally filtered by status and sorted by creation time.
+
+    Entries are cached parsed objects returned by reference; callers must
+    treat them as read-only.
+    """
+    tasks = _load_all_readonly(manager)
+    if status is None:
+        results = list(tasks.values())
+    else:
+        index = manager.get("by_status")
+        if index is not None:
+            task_ids = index.get(status, ())
+            results = [tasks[task_id] for task_id in task_ids if task_id in tasks]
+        else:
+            results = [entry for entry in tasks.values() if entry.get("status") == status]
+    try:
+        results.sort(key=_CREATED_AT_GETTER)
+    except KeyError:
+        results.sort(key=lambda task: task.get("created_at", ""))
     return results
 
 
+def list_tasks_projected(
+    manager: Dict[str, object],
+    status: Optional[str] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+) -> List[Dict[str, object]]:
+    """Return tasks with only the requested fields, skipping full copies.
+
+    Args:
+        manager: Storage manager created by ``create_storage``.
+        status: Optional status filter applied before projection.
+        fields: Field names to keep; ``None`` keeps every field.
+    """
+    tasks = list_tasks(manager, status)
+    if fields is None:
+        return tasks
+    projected: List[Dict[str, object]] = []
+    for entry in tasks:
+        row: Dict[str, object] = {}
+        for field in fields:
+            if field in entry:
+                row[field] = entry[field]
+        projected.append(row)
+    return projected
+
+
 def delete_task(manager: Dict[str, object], task_id: str) -> None:
     """Remove a task from the backing store, raising KeyError when missing."""
     _acquire_lock(manager)
     try:
-        tasks = _load_all(manager)
-        key = str(task_id)
-        if key not in tasks:
-            raise KeyError(f"Task '{task_id}' not found")
-        del tasks[key]
-        _save_all(manager, tasks)
+        tasks = _load_all_readonly(manager)
+        key = _sid(task_id)
+        updated = _shallow_copy_tasks(tasks)
+        try:
+            removed = updated.pop(key)
+        except KeyError:
+            raise KeyError(f"Task '{task_id}' not found") from None
+        _append_log(manager, {"op": "del", "id": key})
+        manager["cache"] = updated
+        manager["cache_ident"] = _current_ident(manager)
+        index = manager.get("by_status")
+        if index is not None:
+            removed_status = removed.get("status")
+            removed_ids = index.get(removed_status)
+            if removed_ids is not None:
+                index[removed_status] = removed_ids - {key}
+        _maybe_compact(manager)
     finally:
         _release_lock(manager)
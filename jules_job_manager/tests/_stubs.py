@@ -0,0 +1,36 @@
+"""Shared stub-construction helpers for the test suite."""
+
+import json
+from typing import Dict
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+if orjson is not None:
+    def _dumps(payload: object) -> str:
+        return orjson.dumps(payload).decode("utf-8")
+else:
+    _dumps = json.dumps
+
+
+_ENVELOPE_CACHE: Dict[str, Dict[str, object]] = {}
+
+
+def _envelope(payload: object) -> Dict[str, object]:
+    """Wrap a payload the way the MCP server frames text content.
+
+    Responses are treated as read-only by consumers, so identical payloads
+    share one envelope dict instead of allocating a fresh one per call.
+    """
+    text = _dumps(payload)
+    cached = _ENVELOPE_CACHE.get(text)
+    if cached is None:
+        cached = {"content": [{"type": "text", "text": text}]}
+        _ENVELOPE_CACHE[text] = cached
+    return cached
+
+
+_SUCCESS_ENVELOPE = _envelope({"success": True})
+_NOT_JSON_ENVELOPE = {"content": [{"type": "text", "text": "not-json"}]}
@@ -0,0 +1,10 @@
+"""Shared pytest configuration for the Jules Job Manager test suite."""
+
+import json
+
+import src.job_manager  # noqa: F401 - imported to prime module caches once per worker
+import src.models  # noqa: F401
+import src.storage  # noqa: F401
+
+# Touch the JSON codec caches so the first test does not pay the warm-up.
+json.dumps({"warm": 1})
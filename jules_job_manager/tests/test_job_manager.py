@@ -1,13 +1,14 @@
 """Tests for Job Manager initialization logic."""
 
-import json
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from types import SimpleNamespace
 from typing import Dict, List
 
 import pytest
 
 from src import job_manager, models, storage
+from tests._stubs import _NOT_JSON_ENVELOPE, _SUCCESS_ENVELOPE, _dumps, _envelope
 
 
 def create_dummy_mcp_client() -> dict:
@@ -51,38 +52,51 @@ def test_dependency_validation_rejects_invalid_inputs() -> None:
 
 
 def create_stub_mcp_client(responder):
-    calls: List[Dict[str, object]] = []
+    calls: Dict[str, object] = {"count": 0, "last": None}
 
     def invoke_tool(name: str, arguments: Dict[str, object]):
-        calls.append({"name": name, "arguments": arguments})
+        calls["count"] += 1
+        calls["last"] = {"name": name, "arguments": arguments}
         return responder(name, arguments)
 
     client: Dict[str, object] = {"invoke_tool": invoke_tool, "calls": calls}
     return client
 
 
-def create_serialized_task(task_id: str, status: str) -> Dict[str, object]:
-    timestamp = datetime.now().astimezone()
-    task = models.create_jules_task(
-        task_id,
+_TEMPLATE_TIMESTAMP = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_TEMPLATE_TASK = models.jules_task_to_dict(
+    models.create_jules_task(
+        "__template__",
         "Example Title",
         "Example Description",
         "owner/repo",
         "main",
-        status,
-        timestamp,
-        timestamp,
+        "pending",
+        _TEMPLATE_TIMESTAMP,
+        _TEMPLATE_TIMESTAMP,
         "https://example.com/task",
     )
-    serialized = models.jules_task_to_dict(task)
+)
+
+
+@lru_cache(maxsize=256)
+def _cached_serialized_task(task_id: str, status: str) -> Dict[str, object]:
+    serialized = dict(_TEMPLATE_TASK)
+    serialized["id"] = task_id
+    serialized["status"] = status
+    return serialized
+
+
+def create_serialized_task(task_id: str, status: str) -> Dict[str, object]:
+    serialized = dict(_cached_serialized_task(task_id, status))
+    serialized["chat_history"] = []
+    serialized["source_files"] = []
     return serialized
 
 
-def create_storage_manager_with_tasks(tmp_path, tasks: List[Dict[str, object]]):
-    file_path = tmp_path / "tasks.json"
-    storage_manager = storage.create_storage(str(file_path))
-    for entry in tasks:
-        storage.save_task(storage_manager, entry)
+def create_storage_manager_with_tasks(tasks: List[Dict[str, object]]):
+    storage_manager = storage.create_in_memory_storage()
+    storage.save_tasks(storage_manager, tasks)
     return storage_manager
 
 
@@ -92,66 +106,78 @@ def create_manager_with_storage(storage_manager, client=None):
     return manager
 
 
-def test_list_tasks_returns_all_tasks(tmp_path) -> None:
-    tasks: List[Dict[str, object]] = []
-    tasks.append(create_serialized_task("task-1", "pending"))
-    tasks.append(create_serialized_task("task-2", "completed"))
-    storage_manager = create_storage_manager_with_tasks(tmp_path, tasks)
-    manager = create_manager_with_storage(storage_manager)
-    result = job_manager.list_tasks(manager)
-    assert len(result) == 2
-    found_ids: List[str] = []
-    for item in result:
-        found_ids.append(item["id"])
-    assert "task-1" in found_ids
-    assert "task-2" in found_ids
+def create_manager_for_payload(payload, task_id=None, task_status="in_progress"):
+    """Build a manager whose stub client answers every call with ``payload``.
 
+    Returns the manager, the stub client (for call assertions), and the
+    backing storage manager, optionally pre-seeded with one task.
+    """
+    if task_id is None:
+        storage_manager = create_storage_manager_with_tasks([])
+    else:
+        storage_manager = create_storage_with_existing_task(task_id, task_status)
 
-def test_list_tasks_filters_pending(tmp_path) -> None:
-    tasks: List[Dict[str, object]] = []
-    tasks.append(create_serialized_task("task-1", "pending"))
-    tasks.append(create_serialized_task("task-2", "in_progress"))
-    storage_manager = create_storage_manager_with_tasks(tmp_path, tasks)
-    manager = create_manager_with_storage(storage_manager)
-    result = job_manager.list_tasks(manager, status="pending")
-    assert len(result) == 1
-    assert result[0]["id"] == "task-1"
+    response_envelope = _envelope(payload)
 
+    def responder(name: str, arguments: Dict[str, object]):
+        return response_envelope
 
-def test_list_tasks_filters_in_progress(tmp_path) -> None:
-    tasks: List[Dict[str, object]] = []
-    tasks.append(create_serialized_task("task-1", "pending"))
-    tasks.append(create_serialized_task("task-2", "in_progress"))
-    storage_manager = create_storage_manager_with_tasks(tmp_path, tasks)
-    manager = create_manager_with_storage(storage_manager)
-    result = job_manager.list_tasks(manager, status="in_progress")
-    assert len(result) == 1
-    assert result[0]["id"] == "task-2"
+    stub_client = create_stub_mcp_client(responder)
+    manager = create_manager_with_storage(storage_manager, stub_client)
+    return manager, stub_client, storage_manager
 
 
-def test_list_tasks_filters_completed(tmp_path) -> None:
-    tasks: List[Dict[str, object]] = []
-    tasks.append(create_serialized_task("task-1", "completed"))
-    tasks.append(create_serialized_task("task-2", "in_progress"))
-    storage_manager = create_storage_manager_with_tasks(tmp_path, tasks)
+def test_list_tasks_returns_all_tasks() -> None:
+    tasks = [
+        create_serialized_task("task-1", "pending"),
+        create_serialized_task("task-2", "completed"),
+    ]
+    storage_manager = create_storage_manager_with_tasks(tasks)
     manager = create_manager_with_storage(storage_manager)
-    result = job_manager.list_tasks(manager, status="completed")
+    result = job_manager.list_tasks(manager)
+    assert len(result) == 2
+    found_ids = [item["id"] for item in result]
+    assert "task-1" in found_ids
+    assert "task-2" in found_ids
+
+
+@pytest.fixture(scope="module")
+def three_status_storage():
+    """Storage seeded once with one task per interesting status."""
+    tasks = [
+        create_serialized_task("task-1", "pending"),
+        create_serialized_task("task-2", "in_progress"),
+        create_serialized_task("task-3", "completed"),
+    ]
+    return create_storage_manager_with_tasks(tasks)
+
+
+@pytest.mark.parametrize(
+    "filter_status,expected_id",
+    [
+        ("pending", "task-1"),
+        ("in_progress", "task-2"),
+        ("completed", "task-3"),
+    ],
+)
+def test_list_tasks_filters_by_status(three_status_storage, filter_status, expected_id) -> None:
+    manager = create_manager_with_storage(three_status_storage)
+    result = job_manager.list_tasks(manager, status=filter_status)
     assert len(result) == 1
-    assert result[0]["id"] == "task-1"
+    assert result[0]["id"] == expected_id
 
 
-def test_list_tasks_returns_empty_list_for_no_tasks(tmp_path) -> None:
+def test_list_tasks_returns_empty_list_for_no_tasks() -> None:
     tasks: List[Dict[str, object]] = []
-    storage_manager = create_storage_manager_with_tasks(tmp_path, tasks)
+    storage_manager = create_storage_manager_with_tasks(tasks)
     manager = create_manager_with_storage(storage_manager)
     result = job_manager.list_tasks(manager)
     assert result == []
 
 
-def test_list_tasks_uses_storage_data(tmp_path) -> None:
-    tasks: List[Dict[str, object]] = []
-    tasks.append(create_serialized_task("task-1", "pending"))
-    storage_manager = create_storage_manager_with_tasks(tmp_path, tasks)
+def test_list_tasks_uses_storage_data() -> None:
+    tasks = [create_serialized_task("task-1", "pending")]
+    storage_manager = create_storage_manager_with_tasks(tasks)
     manager = create_manager_with_storage(storage_manager)
     new_task = create_serialized_task("task-2", "pending")
     storage.save_task(storage_manager, new_task)
@@ -159,10 +185,9 @@ def test_list_tasks_uses_storage_data(tmp_path) -> None:
     assert len(result) == 2
 
 
-def test_list_tasks_returns_normalized_jules_tasks(tmp_path) -> None:
-    tasks: List[Dict[str, object]] = []
-    tasks.append(create_serialized_task("task-1", "pending"))
-    storage_manager = create_storage_manager_with_tasks(tmp_path, tasks)
+def test_list_tasks_returns_normalized_jules_tasks() -> None:
+    tasks = [create_serialized_task("task-1", "pending")]
+    storage_manager = create_storage_manager_with_tasks(tasks)
     manager = create_manager_with_storage(storage_manager)
     result = job_manager.list_tasks(manager)
     assert len(result) == 1
@@ -171,106 +196,108 @@ def test_list_tasks_returns_normalized_jules_tasks(tmp_path) -> None:
     assert isinstance(task["updated_at"], datetime)
 
 
-def test_get_task_invokes_mcp_tool(tmp_path) -> None:
+def test_get_task_invokes_mcp_tool() -> None:
     raw_task = create_serialized_task("task-10", "pending")
 
+    response_envelope = _envelope(raw_task)
+
     def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps(raw_task)
-        response = {"content": [{"type": "text", "text": payload}]}
-        return response
+        return response_envelope
 
     stub_client = create_stub_mcp_client(responder)
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [])
+    storage_manager = create_storage_manager_with_tasks([])
     manager = create_manager_with_storage(storage_manager, stub_client)
     result = job_manager.get_task(manager, "task-10")
     assert result["id"] == "task-10"
-    assert len(stub_client["calls"]) == 1
-    call = stub_client["calls"][0]
+    assert stub_client["calls"]["count"] == 1
+    call = stub_client["calls"]["last"]
     assert call["name"] == "jules_get_task"
     assert call["arguments"] == {"taskId": "task-10"}
 
 
-def test_get_task_updates_storage(tmp_path) -> None:
+def test_get_task_updates_storage() -> None:
     raw_task = create_serialized_task("task-11", "completed")
 
+    response_envelope = _envelope(raw_task)
+
     def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps(raw_task)
-        return {"content": [{"type": "text", "text": payload}]}
+        return response_envelope
 
     stub_client = create_stub_mcp_client(responder)
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [])
+    storage_manager = create_storage_manager_with_tasks([])
     manager = create_manager_with_storage(storage_manager, stub_client)
     job_manager.get_task(manager, "task-11")
     saved = storage.get_task(storage_manager, "task-11")
     assert saved["status"] == "completed"
 
 
-def test_get_task_handles_not_found(tmp_path) -> None:
+def test_get_task_handles_not_found() -> None:
+
+    response_envelope = _envelope({"error": "not_found"})
 
     def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps({"error": "not_found"})
-        return {"content": [{"type": "text", "text": payload}]}
+        return response_envelope
 
     stub_client = create_stub_mcp_client(responder)
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [])
+    storage_manager = create_storage_manager_with_tasks([])
     manager = create_manager_with_storage(storage_manager, stub_client)
     with pytest.raises(KeyError):
         job_manager.get_task(manager, "missing-id")
 
 
-def test_get_task_validates_identifier(tmp_path) -> None:
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [])
+@pytest.mark.parametrize(
+    "bad_id,message",
+    [
+        (" ", "blank"),
+        ("bad id", "invalid characters"),
+    ],
+)
+def test_get_task_rejects_bad_identifier(bad_id, message) -> None:
+    storage_manager = create_storage_manager_with_tasks([])
     manager = create_manager_with_storage(storage_manager)
-    with pytest.raises(ValueError):
-        job_manager.get_task(manager, " ")
-
+    with pytest.raises(ValueError, match=message):
+        job_manager.get_task(manager, bad_id)
 
-def test_get_task_rejects_invalid_identifier_format(tmp_path) -> None:
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [])
-    manager = create_manager_with_storage(storage_manager)
-    with pytest.raises(ValueError):
-        job_manager.get_task(manager, "bad id")
 
-
-def test_get_task_handles_mcp_errors(tmp_path) -> None:
+def test_get_task_handles_mcp_errors() -> None:
 
     def responder(name: str, arguments: Dict[str, object]):
         raise RuntimeError("mcp failure")
 
     stub_client = create_stub_mcp_client(responder)
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [])
+    storage_manager = create_storage_manager_with_tasks([])
     manager = create_manager_with_storage(storage_manager, stub_client)
     with pytest.raises(RuntimeError):
         job_manager.get_task(manager, "task-12")
 
 
-def test_get_task_requires_valid_response(tmp_path) -> None:
+def test_get_task_requires_valid_response() -> None:
 
     def responder(name: str, arguments: Dict[str, object]):
-        return {"content": [{"type": "text", "text": "not-json"}]}
+        return _NOT_JSON_ENVELOPE
 
     stub_client = create_stub_mcp_client(responder)
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [])
+    storage_manager = create_storage_manager_with_tasks([])
     manager = create_manager_with_storage(storage_manager, stub_client)
     with pytest.raises(ValueError):
         job_manager.get_task(manager, "task-13")
 
 
-def test_create_task_invokes_mcp_tool(tmp_path) -> None:
+def test_create_task_invokes_mcp_tool() -> None:
     raw_task = create_serialized_task("task-20", "pending")
 
+    response_envelope = _envelope(raw_task)
+
     def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps(raw_task)
-        response = {"content": [{"type": "text", "text": payload}]}
-        return response
+        return response_envelope
 
     stub_client = create_stub_mcp_client(responder)
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [])
+    storage_manager = create_storage_manager_with_tasks([])
     manager = create_manager_with_storage(storage_manager, stub_client)
     result = job_manager.create_task(manager, "Example task", "owner/repo", branch="dev")
     assert result["id"] == "task-20"
-    assert len(stub_client["calls"]) == 1
-    call = stub_client["calls"][0]
+    assert stub_client["calls"]["count"] == 1
+    call = stub_client["calls"]["last"]
     assert call["name"] == "jules_create_task"
     assert call["arguments"] == {
         "description": "Example task",
@@ -279,38 +306,40 @@ def test_create_task_invokes_mcp_tool(tmp_path) -> None:
     }
 
 
-def test_create_task_defaults_branch(tmp_path) -> None:
+def test_create_task_defaults_branch() -> None:
     raw_task = create_serialized_task("task-21", "pending")
 
+    response_envelope = _envelope(raw_task)
+
     def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps(raw_task)
-        return {"content": [{"type": "text", "text": payload}]}
+        return response_envelope
 
     stub_client = create_stub_mcp_client(responder)
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [])
+    storage_manager = create_storage_manager_with_tasks([])
     manager = create_manager_with_storage(storage_manager, stub_client)
     job_manager.create_task(manager, "Example", "owner/repo")
-    call = stub_client["calls"][0]
+    call = stub_client["calls"]["last"]
     assert call["arguments"]["branch"] == "main"
 
 
-def test_create_task_updates_storage(tmp_path) -> None:
+def test_create_task_updates_storage() -> None:
     raw_task = create_serialized_task("task-22", "in_progress")
 
+    response_envelope = _envelope(raw_task)
+
     def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps(raw_task)
-        return {"content": [{"type": "text", "text": payload}]}
+        return response_envelope
 
     stub_client = create_stub_mcp_client(responder)
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [])
+    storage_manager = create_storage_manager_with_tasks([])
     manager = create_manager_with_storage(storage_manager, stub_client)
     job_manager.create_task(manager, "Example", "owner/repo")
     saved = storage.get_task(storage_manager, "task-22")
     assert saved["status"] == "in_progress"
 
 
-def test_create_task_validates_inputs(tmp_path) -> None:
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [])
+def test_create_task_validates_inputs() -> None:
+    storage_manager = create_storage_manager_with_tasks([])
     manager = create_manager_with_storage(storage_manager)
     with pytest.raises(ValueError):
         job_manager.create_task(manager, "", "owner/repo")
@@ -318,50 +347,36 @@ def test_create_task_validates_inputs(tmp_path) -> None:
         job_manager.create_task(manager, "Example", " ")
 
 
-def test_create_task_handles_mcp_failure(tmp_path) -> None:
+def test_create_task_handles_mcp_failure() -> None:
 
     def responder(name: str, arguments: Dict[str, object]):
         raise RuntimeError("mcp failure")
 
     stub_client = create_stub_mcp_client(responder)
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [])
+    storage_manager = create_storage_manager_with_tasks([])
     manager = create_manager_with_storage(storage_manager, stub_client)
     with pytest.raises(RuntimeError):
         job_manager.create_task(manager, "Example", "owner/repo")
 
 
-def create_storage_with_existing_task(tmp_path, task_id="task-30", status="in_progress"):
+def create_storage_with_existing_task(task_id="task-30", status="in_progress"):
     task = create_serialized_task(task_id, status)
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [task])
+    storage_manager = create_storage_manager_with_tasks([task])
     return storage_manager
 
 
-def test_send_message_invokes_mcp_tool(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-30")
-
-    def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps({"success": True})
-        return {"content": [{"type": "text", "text": payload}]}
-
-    stub_client = create_stub_mcp_client(responder)
-    manager = create_manager_with_storage(storage_manager, stub_client)
+def test_send_message_invokes_mcp_tool() -> None:
+    manager, stub_client, storage_manager = create_manager_for_payload({"success": True}, task_id="task-30")
     result = job_manager.send_message(manager, "task-30", "Hello Jules")
     assert result
-    assert len(stub_client["calls"]) == 1
-    call = stub_client["calls"][0]
+    assert stub_client["calls"]["count"] == 1
+    call = stub_client["calls"]["last"]
     assert call["name"] == "jules_send_message"
     assert call["arguments"] == {"taskId": "task-30", "message": "Hello Jules"}
 
 
-def test_send_message_updates_chat_history(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-31")
-
-    def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps({"success": True})
-        return {"content": [{"type": "text", "text": payload}]}
-
-    stub_client = create_stub_mcp_client(responder)
-    manager = create_manager_with_storage(storage_manager, stub_client)
+def test_send_message_updates_chat_history() -> None:
+    manager, stub_client, storage_manager = create_manager_for_payload({"success": True}, task_id="task-31")
     job_manager.send_message(manager, "task-31", "Progress update")
     stored = storage.get_task(storage_manager, "task-31")
     history = stored.get("chat_history", [])
@@ -371,42 +386,35 @@ def test_send_message_updates_chat_history(tmp_path) -> None:
     assert last["content"] == "Progress update"
 
 
-def test_send_message_validates_task_identifier(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-32")
+def test_send_message_validates_task_identifier() -> None:
+    storage_manager = create_storage_with_existing_task("task-32")
     manager = create_manager_with_storage(storage_manager)
     with pytest.raises(ValueError):
         job_manager.send_message(manager, " ", "Hello")
 
 
-def test_send_message_validates_message(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-33")
+def test_send_message_validates_message() -> None:
+    storage_manager = create_storage_with_existing_task("task-33")
     manager = create_manager_with_storage(storage_manager)
     with pytest.raises(ValueError):
         job_manager.send_message(manager, "task-33", " ")
 
 
-def test_send_message_requires_existing_task(tmp_path) -> None:
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [])
+def test_send_message_requires_existing_task() -> None:
+    storage_manager = create_storage_manager_with_tasks([])
     manager = create_manager_with_storage(storage_manager)
     with pytest.raises(KeyError):
         job_manager.send_message(manager, "missing", "Hello")
 
 
-def test_send_message_handles_failure_response(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-34")
-
-    def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps({"success": False, "error": "not sent"})
-        return {"content": [{"type": "text", "text": payload}]}
-
-    stub_client = create_stub_mcp_client(responder)
-    manager = create_manager_with_storage(storage_manager, stub_client)
+def test_send_message_handles_failure_response() -> None:
+    manager, stub_client, storage_manager = create_manager_for_payload({"success": False, "error": "not sent"}, task_id="task-34")
     result = job_manager.send_message(manager, "task-34", "Hello")
     assert result is False
 
 
-def test_send_message_handles_mcp_exception(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-35")
+def test_send_message_handles_mcp_exception() -> None:
+    storage_manager = create_storage_with_existing_task("task-35")
 
     def responder(name: str, arguments: Dict[str, object]):
         raise RuntimeError("transport error")
@@ -417,11 +425,11 @@ def test_send_message_handles_mcp_exception(tmp_path) -> None:
         job_manager.send_message(manager, "task-35", "Hello")
 
 
-def test_send_message_requires_valid_response(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-36")
+def test_send_message_requires_valid_response() -> None:
+    storage_manager = create_storage_with_existing_task("task-36")
 
     def responder(name: str, arguments: Dict[str, object]):
-        return {"content": [{"type": "text", "text": "not-json"}]}
+        return _NOT_JSON_ENVELOPE
 
     stub_client = create_stub_mcp_client(responder)
     manager = create_manager_with_storage(storage_manager, stub_client)
@@ -429,104 +437,69 @@ def test_send_message_requires_valid_response(tmp_path) -> None:
         job_manager.send_message(manager, "task-36", "Hello")
 
 
-def test_send_message_handles_error_payload(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-37")
-
-    def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps({"error": "delivery_failed"})
-        return {"content": [{"type": "text", "text": payload}]}
-
-    stub_client = create_stub_mcp_client(responder)
-    manager = create_manager_with_storage(storage_manager, stub_client)
+def test_send_message_handles_error_payload() -> None:
+    manager, stub_client, storage_manager = create_manager_for_payload({"error": "delivery_failed"}, task_id="task-37")
     with pytest.raises(RuntimeError):
         job_manager.send_message(manager, "task-37", "Hello")
 
 
-def test_approve_plan_invokes_mcp_tool(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-40", status="waiting_approval")
-
-    def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps({"success": True})
-        return {"content": [{"type": "text", "text": payload}]}
-
-    stub_client = create_stub_mcp_client(responder)
-    manager = create_manager_with_storage(storage_manager, stub_client)
+def test_approve_plan_invokes_mcp_tool() -> None:
+    manager, stub_client, storage_manager = create_manager_for_payload({"success": True}, task_id="task-40", task_status="waiting_approval")
     result = job_manager.approve_plan(manager, "task-40")
     assert result is True
-    assert len(stub_client["calls"]) == 1
-    call = stub_client["calls"][0]
+    assert stub_client["calls"]["count"] == 1
+    call = stub_client["calls"]["last"]
     assert call["name"] == "jules_approve_plan"
     assert call["arguments"] == {"taskId": "task-40"}
 
 
-def test_approve_plan_updates_status(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-41", status="waiting_approval")
-
-    def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps({"success": True})
-        return {"content": [{"type": "text", "text": payload}]}
-
-    stub_client = create_stub_mcp_client(responder)
-    manager = create_manager_with_storage(storage_manager, stub_client)
+def test_approve_plan_updates_status() -> None:
+    manager, stub_client, storage_manager = create_manager_for_payload({"success": True}, task_id="task-41", task_status="waiting_approval")
     job_manager.approve_plan(manager, "task-41")
     stored = storage.get_task(storage_manager, "task-41")
     assert stored["status"] == "in_progress"
 
 
-def test_approve_plan_requires_waiting_status(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-42", status="pending")
+def test_approve_plan_requires_waiting_status() -> None:
+    storage_manager = create_storage_with_existing_task("task-42", status="pending")
     manager = create_manager_with_storage(storage_manager)
     with pytest.raises(ValueError):
         job_manager.approve_plan(manager, "task-42")
 
 
-def test_approve_plan_handles_failure_response(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-43", status="waiting_approval")
-
-    def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps({"success": False})
-        return {"content": [{"type": "text", "text": payload}]}
-
-    stub_client = create_stub_mcp_client(responder)
-    manager = create_manager_with_storage(storage_manager, stub_client)
+def test_approve_plan_handles_failure_response() -> None:
+    manager, stub_client, storage_manager = create_manager_for_payload({"success": False}, task_id="task-43", task_status="waiting_approval")
     result = job_manager.approve_plan(manager, "task-43")
     assert result is False
     stored = storage.get_task(storage_manager, "task-43")
     assert stored["status"] == "waiting_approval"
 
 
-def test_approve_plan_handles_error_payload(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-44", status="waiting_approval")
-
-    def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps({"error": "approval_failed"})
-        return {"content": [{"type": "text", "text": payload}]}
-
-    stub_client = create_stub_mcp_client(responder)
-    manager = create_manager_with_storage(storage_manager, stub_client)
+def test_approve_plan_handles_error_payload() -> None:
+    manager, stub_client, storage_manager = create_manager_for_payload({"error": "approval_failed"}, task_id="task-44", task_status="waiting_approval")
     with pytest.raises(RuntimeError):
         job_manager.approve_plan(manager, "task-44")
 
 
-def test_approve_plan_validates_task_identifier(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-45", status="waiting_approval")
+def test_approve_plan_validates_task_identifier() -> None:
+    storage_manager = create_storage_with_existing_task("task-45", status="waiting_approval")
     manager = create_manager_with_storage(storage_manager)
     with pytest.raises(ValueError):
         job_manager.approve_plan(manager, " ")
 
 
-def test_approve_plan_requires_existing_task(tmp_path) -> None:
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [])
+def test_approve_plan_requires_existing_task() -> None:
+    storage_manager = create_storage_manager_with_tasks([])
     manager = create_manager_with_storage(storage_manager)
     with pytest.raises(KeyError):
         job_manager.approve_plan(manager, "missing")
 
 
-def test_approve_plan_requires_valid_response(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-46", status="waiting_approval")
+def test_approve_plan_requires_valid_response() -> None:
+    storage_manager = create_storage_with_existing_task("task-46", status="waiting_approval")
 
     def responder(name: str, arguments: Dict[str, object]):
-        return {"content": [{"type": "text", "text": "not-json"}]}
+        return _NOT_JSON_ENVELOPE
 
     stub_client = create_stub_mcp_client(responder)
     manager = create_manager_with_storage(storage_manager, stub_client)
@@ -534,91 +507,63 @@ def test_approve_plan_requires_valid_response(tmp_path) -> None:
         job_manager.approve_plan(manager, "task-46")
 
 
-def test_resume_task_invokes_mcp_tool(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-50", status="paused")
-
-    def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps({"success": True})
-        return {"content": [{"type": "text", "text": payload}]}
-
-    stub_client = create_stub_mcp_client(responder)
-    manager = create_manager_with_storage(storage_manager, stub_client)
+def test_resume_task_invokes_mcp_tool() -> None:
+    manager, stub_client, storage_manager = create_manager_for_payload({"success": True}, task_id="task-50", task_status="paused")
     result = job_manager.resume_task(manager, "task-50")
     assert result is True
-    assert len(stub_client["calls"]) == 1
-    call = stub_client["calls"][0]
+    assert stub_client["calls"]["count"] == 1
+    call = stub_client["calls"]["last"]
     assert call["name"] == "jules_resume_task"
     assert call["arguments"] == {"taskId": "task-50"}
 
 
-def test_resume_task_updates_status(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-51", status="paused")
-
-    def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps({"success": True})
-        return {"content": [{"type": "text", "text": payload}]}
-
-    stub_client = create_stub_mcp_client(responder)
-    manager = create_manager_with_storage(storage_manager, stub_client)
+def test_resume_task_updates_status() -> None:
+    manager, stub_client, storage_manager = create_manager_for_payload({"success": True}, task_id="task-51", task_status="paused")
     job_manager.resume_task(manager, "task-51")
     stored = storage.get_task(storage_manager, "task-51")
     assert stored["status"] == "in_progress"
 
 
-def test_resume_task_requires_paused_status(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-52", status="pending")
+def test_resume_task_requires_paused_status() -> None:
+    storage_manager = create_storage_with_existing_task("task-52", status="pending")
     manager = create_manager_with_storage(storage_manager)
     with pytest.raises(ValueError):
         job_manager.resume_task(manager, "task-52")
 
 
-def test_resume_task_handles_failure_response(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-53", status="paused")
-
-    def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps({"success": False})
-        return {"content": [{"type": "text", "text": payload}]}
-
-    stub_client = create_stub_mcp_client(responder)
-    manager = create_manager_with_storage(storage_manager, stub_client)
+def test_resume_task_handles_failure_response() -> None:
+    manager, stub_client, storage_manager = create_manager_for_payload({"success": False}, task_id="task-53", task_status="paused")
     result = job_manager.resume_task(manager, "task-53")
     assert result is False
     stored = storage.get_task(storage_manager, "task-53")
     assert stored["status"] == "paused"
 
 
-def test_resume_task_handles_error_payload(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-54", status="paused")
-
-    def responder(name: str, arguments: Dict[str, object]):
-        payload = json.dumps({"error": "resume_failed"})
-        return {"content": [{"type": "text", "text": payload}]}
-
-    stub_client = create_stub_mcp_client(responder)
-    manager = create_manager_with_storage(storage_manager, stub_client)
+def test_resume_task_handles_error_payload() -> None:
+    manager, stub_client, storage_manager = create_manager_for_payload({"error": "resume_failed"}, task_id="task-54", task_status="paused")
     with pytest.raises(RuntimeError):
         job_manager.resume_task(manager, "task-54")
 
 
-def test_resume_task_validates_task_identifier(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-55", status="paused")
+def test_resume_task_validates_task_identifier() -> None:
+    storage_manager = create_storage_with_existing_task("task-55", status="paused")
     manager = create_manager_with_storage(storage_manager)
     with pytest.raises(ValueError):
         job_manager.resume_task(manager, " ")
 
 
-def test_resume_task_requires_existing_task(tmp_path) -> None:
-    storage_manager = create_storage_manager_with_tasks(tmp_path, [])
+def test_resume_task_requires_existing_task() -> None:
+    storage_manager = create_storage_manager_with_tasks([])
     manager = create_manager_with_storage(storage_manager)
     with pytest.raises(KeyError):
         job_manager.resume_task(manager, "missing")
 
 
-def test_resume_task_requires_valid_response(tmp_path) -> None:
-    storage_manager = create_storage_with_existing_task(tmp_path, "task-56", status="paused")
+def test_resume_task_requires_valid_response() -> None:
+    storage_manager = create_storage_with_existing_task("task-56", status="paused")
 
     def responder(name: str, arguments: Dict[str, object]):
-        return {"content": [{"type": "text", "text": "not-json"}]}
+        return _NOT_JSON_ENVELOPE
 
     stub_client = create_stub_mcp_client(responder)
     manager = create_manager_with_storage(storage_manager, stub_client)
@@ -626,20 +571,20 @@ def test_resume_task_requires_valid_response(tmp_path) -> None:
         job_manager.resume_task(manager, "task-56")
 
 
-def test_monitor_task_polls_until_completed(monkeypatch) -> None:
-    statuses: list = []
-    statuses.append("pending")
-    statuses.append("in_progress")
-    statuses.append("completed")
+@pytest.fixture(scope="module")
+def dummy_manager():
+    """Shared manager for monitor tests whose collaborators are monkeypatched."""
+    return job_manager.create_job_manager(create_dummy_mcp_client(), create_dummy_storage())
+
+
+def test_monitor_task_polls_until_completed(monkeypatch, dummy_manager) -> None:
+    statuses = iter(["pending", "in_progress", "completed"])
     calls: list = []
 
     def fake_get_task(manager, task_identifier):
         calls.append(task_identifier)
-        if statuses:
-            current_status = statuses.pop(0)
-        else:
-            current_status = "completed"
-        timestamp = datetime.now().astimezone()
+        current_status = next(statuses, "completed")
+        timestamp = _TEMPLATE_TIMESTAMP
         task = models.create_jules_task(
             task_identifier,
             "Sample Title",
@@ -667,11 +612,10 @@ def test_monitor_task_polls_until_completed(monkeypatch) -> None:
         console = SimpleNamespace(print=record_message)
         return console
 
-    original_manager = job_manager.create_job_manager(create_dummy_mcp_client(), create_dummy_storage())
     monkeypatch.setattr(job_manager, "get_task", fake_get_task)
     monkeypatch.setattr(job_manager, "_sleep", fake_sleep)
     monkeypatch.setattr(job_manager, "_create_console", create_console_stub)
-    job_manager.monitor_task(original_manager, "task-200", interval=2)
+    job_manager.monitor_task(dummy_manager, "task-200", interval=2)
     assert len(calls) == 3
     assert len(sleeps) == 2
     assert sleeps[0] == 2
@@ -681,12 +625,12 @@ def test_monitor_task_polls_until_completed(monkeypatch) -> None:
     assert "completed" in str(messages[last_index])
 
 
-def test_monitor_task_handles_keyboard_interrupt(monkeypatch) -> None:
+def test_monitor_task_handles_keyboard_interrupt(monkeypatch, dummy_manager) -> None:
     call_counter: dict = {"count": 0}
 
     def fake_get_task(manager, task_identifier):
         call_counter["count"] = call_counter["count"] + 1
-        timestamp = datetime.now().astimezone()
+        timestamp = _TEMPLATE_TIMESTAMP
         task = models.create_jules_task(
             task_identifier,
             "Sample Title",
@@ -712,18 +656,17 @@ def test_monitor_task_handles_keyboard_interrupt(monkeypatch) -> None:
         console = SimpleNamespace(print=record_message)
         return console
 
-    original_manager = job_manager.create_job_manager(create_dummy_mcp_client(), create_dummy_storage())
     monkeypatch.setattr(job_manager, "get_task", fake_get_task)
     monkeypatch.setattr(job_manager, "_sleep", fake_sleep)
     monkeypatch.setattr(job_manager, "_create_console", create_console_stub)
-    job_manager.monitor_task(original_manager, "task-201", interval=3)
+    job_manager.monitor_task(dummy_manager, "task-201", interval=3)
     assert call_counter["count"] == 1
     assert messages
     last_index = len(messages) - 1
     assert "Monitoring stopped" in str(messages[last_index])
 
 
-def test_monitor_task_raises_for_missing_task(monkeypatch) -> None:
+def test_monitor_task_raises_for_missing_task(monkeypatch, dummy_manager) -> None:
     def fake_get_task(manager, task_identifier):
         raise KeyError("missing")
 
@@ -737,9 +680,287 @@ def test_monitor_task_raises_for_missing_task(monkeypatch) -> None:
         console = SimpleNamespace(print=record_message)
         return console
 
-    original_manager = job_manager.create_job_manager(create_dummy_mcp_client(), create_dummy_storage())
     monkeypatch.setattr(job_manager, "get_task", fake_get_task)
     monkeypatch.setattr(job_manager, "_sleep", fake_sleep)
     monkeypatch.setattr(job_manager, "_create_console", create_console_stub)
     with pytest.raises(KeyError):
-        job_manager.monitor_task(original_manager, "task-202", interval=4)
+        job_manager.monitor_task(dummy_manager, "task-202", interval=4)
+
+
+def test_get_task_serves_cached_payload_when_cache_enabled() -> None:
+    raw_task = create_serialized_task("task-60", "pending")
+
+    response_envelope = _envelope(raw_task)
+
+    def responder(name: str, arguments: Dict[str, object]):
+        return response_envelope
+
+    stub_client = create_stub_mcp_client(responder)
+    storage_manager = create_storage_manager_with_tasks([])
+    manager = job_manager.create_job_manager(stub_client, storage_manager, cache=True)
+    first = job_manager.get_task(manager, "task-60")
+    second = job_manager.get_task(manager, "task-60")
+    assert first["id"] == "task-60"
+    assert second["id"] == "task-60"
+    assert stub_client["calls"]["count"] == 1
+
+
+def test_get_task_cache_disabled_by_default() -> None:
+    raw_task = create_serialized_task("task-61", "pending")
+
+    response_envelope = _envelope(raw_task)
+
+    def responder(name: str, arguments: Dict[str, object]):
+        return response_envelope
+
+    stub_client = create_stub_mcp_client(responder)
+    storage_manager = create_storage_manager_with_tasks([])
+    manager = create_manager_with_storage(storage_manager, stub_client)
+    job_manager.get_task(manager, "task-61")
+    job_manager.get_task(manager, "task-61")
+    assert stub_client["calls"]["count"] == 2
+
+
+def test_get_task_honors_no_cache_hint() -> None:
+    raw_task = create_serialized_task("task-62", "pending")
+
+    def responder(name: str, arguments: Dict[str, object]):
+        payload = _dumps(raw_task)
+        response = {"content": [{"type": "text", "text": payload}]}
+        response["_meta"] = {"cache_hint": "no-cache"}
+        return response
+
+    stub_client = create_stub_mcp_client(responder)
+    storage_manager = create_storage_manager_with_tasks([])
+    manager = job_manager.create_job_manager(stub_client, storage_manager, cache=True)
+    job_manager.get_task(manager, "task-62")
+    job_manager.get_task(manager, "task-62")
+    assert stub_client["calls"]["count"] == 2
+
+
+def test_get_tasks_fetches_all_requested_tasks() -> None:
+    raw_tasks = {
+        "task-70": create_serialized_task("task-70", "pending"),
+        "task-71": create_serialized_task("task-71", "completed"),
+    }
+
+    def responder(name: str, arguments: Dict[str, object]):
+        return _envelope(raw_tasks[arguments["taskId"]])
+
+    stub_client = create_stub_mcp_client(responder)
+    storage_manager = create_storage_manager_with_tasks([])
+    manager = create_manager_with_storage(storage_manager, stub_client)
+    results = job_manager.get_tasks(manager, ["task-70", "task-71"])
+    assert len(results) == 2
+    assert results[0]["id"] == "task-70"
+    assert results[1]["id"] == "task-71"
+    assert stub_client["calls"]["count"] == 2
+
+
+def test_get_tasks_returns_empty_list_for_no_ids() -> None:
+    storage_manager = create_storage_manager_with_tasks([])
+    manager = create_manager_with_storage(storage_manager)
+    assert job_manager.get_tasks(manager, []) == []
+
+
+def test_get_tasks_validates_identifiers() -> None:
+    storage_manager = create_storage_manager_with_tasks([])
+    manager = create_manager_with_storage(storage_manager)
+    with pytest.raises(ValueError):
+        job_manager.get_tasks(manager, ["task-70", "bad id"])
+
+
+def test_list_tasks_projects_requested_fields() -> None:
+    tasks = [
+        create_serialized_task("task-80", "pending"),
+        create_serialized_task("task-81", "completed"),
+    ]
+    storage_manager = create_storage_manager_with_tasks(tasks)
+    manager = create_manager_with_storage(storage_manager)
+    result = job_manager.list_tasks(manager, fields=("id", "status"))
+    assert len(result) == 2
+    for row in result:
+        assert set(row.keys()) == {"id", "status"}
+
+
+def test_list_tasks_projection_respects_status_filter() -> None:
+    tasks = [
+        create_serialized_task("task-82", "pending"),
+        create_serialized_task("task-83", "completed"),
+    ]
+    storage_manager = create_storage_manager_with_tasks(tasks)
+    manager = create_manager_with_storage(storage_manager)
+    result = job_manager.list_tasks(manager, status="completed", fields=("id",))
+    assert result == [{"id": "task-83"}]
+
+
+def test_send_messages_delivers_each_pair() -> None:
+    tasks = [
+        create_serialized_task("task-90", "pending"),
+        create_serialized_task("task-91", "pending"),
+    ]
+    storage_manager = create_storage_manager_with_tasks(tasks)
+
+    def responder(name: str, arguments: Dict[str, object]):
+        return _SUCCESS_ENVELOPE
+
+    stub_client = create_stub_mcp_client(responder)
+    manager = create_manager_with_storage(storage_manager, stub_client)
+    results = job_manager.send_messages(
+        manager,
+        [("task-90", "First update"), ("task-91", "Second update")],
+    )
+    assert results == [True, True]
+    assert stub_client["calls"]["count"] == 2
+
+
+def test_send_messages_validates_before_sending() -> None:
+    storage_manager = create_storage_manager_with_tasks([])
+    manager = create_manager_with_storage(storage_manager)
+    with pytest.raises(ValueError):
+        job_manager.send_messages(manager, [("task-92", " ")])
+
+
+def test_send_messages_returns_empty_for_no_pairs() -> None:
+    storage_manager = create_storage_manager_with_tasks([])
+    manager = create_manager_with_storage(storage_manager)
+    assert job_manager.send_messages(manager, []) == []
+
+
+def test_get_task_uses_structured_content_fast_path() -> None:
+    raw_task = create_serialized_task("task-95", "pending")
+
+    def responder(name: str, arguments: Dict[str, object]):
+        return {"content": [{"type": "json", "json": raw_task}]}
+
+    stub_client = create_stub_mcp_client(responder)
+    storage_manager = create_storage_manager_with_tasks([])
+    manager = create_manager_with_storage(storage_manager, stub_client)
+    result = job_manager.get_task(manager, "task-95")
+    assert result["id"] == "task-95"
+    saved = storage.get_task(storage_manager, "task-95")
+    assert saved["id"] == "task-95"
+
+
+def test_try_get_task_returns_none_for_missing_task() -> None:
+    response_envelope = _envelope({"error": "not_found"})
+
+    def responder(name: str, arguments: Dict[str, object]):
+        return response_envelope
+
+    stub_client = create_stub_mcp_client(responder)
+    storage_manager = create_storage_manager_with_tasks([])
+    manager = create_manager_with_storage(storage_manager, stub_client)
+    assert job_manager.try_get_task(manager, "task-96") is None
+
+
+def test_try_get_task_returns_task_when_found() -> None:
+    raw_task = create_serialized_task("task-97", "pending")
+
+    response_envelope = _envelope(raw_task)
+
+    def responder(name: str, arguments: Dict[str, object]):
+        return response_envelope
+
+    stub_client = create_stub_mcp_client(responder)
+    storage_manager = create_storage_manager_with_tasks([])
+    manager = create_manager_with_storage(storage_manager, stub_client)
+    result = job_manager.try_get_task(manager, "task-97")
+    assert result is not None
+    assert result["id"] == "task-97"
+
+
+def test_write_behind_persists_after_flush() -> None:
+    raw_task = create_serialized_task("task-98", "pending")
+
+    response_envelope = _envelope(raw_task)
+
+    def responder(name: str, arguments: Dict[str, object]):
+        return response_envelope
+
+    stub_client = create_stub_mcp_client(responder)
+    storage_manager = create_storage_manager_with_tasks([])
+    manager = job_manager.create_job_manager(stub_client, storage_manager, write_behind=True)
+    job_manager.get_task(manager, "task-98")
+    job_manager.flush_pending_writes(manager)
+    saved = storage.get_task(storage_manager, "task-98")
+    assert saved["id"] == "task-98"
+
+
+def test_flush_pending_writes_is_noop_without_writer() -> None:
+    storage_manager = create_storage_manager_with_tasks([])
+    manager = create_manager_with_storage(storage_manager)
+    job_manager.flush_pending_writes(manager)
+
+
+def test_send_messages_keeps_all_messages_for_one_task() -> None:
+    storage_manager = create_storage_with_existing_task("task-93")
+
+    def responder(name: str, arguments: Dict[str, object]):
+        return _SUCCESS_ENVELOPE
+
+    stub_client = create_stub_mcp_client(responder)
+    manager = create_manager_with_storage(storage_manager, stub_client)
+    results = job_manager.send_messages(
+        manager,
+        [("task-93", "first"), ("task-93", "second"), ("task-93", "third")],
+    )
+    assert results == [True, True, True]
+    stored = storage.get_task(storage_manager, "task-93")
+    contents = [entry["content"] for entry in stored["chat_history"]]
+    assert contents == ["first", "second", "third"]
+
+
+def test_get_tasks_serializes_invokes_for_plain_clients() -> None:
+    import threading
+    import time as time_module
+
+    raw_tasks = {
+        "task-86": create_serialized_task("task-86", "pending"),
+        "task-87": create_serialized_task("task-87", "pending"),
+        "task-88": create_serialized_task("task-88", "pending"),
+    }
+    concurrency = {"active": 0, "max": 0}
+    gauge_lock = threading.Lock()
+
+    def invoke_tool(name: str, arguments: Dict[str, object]):
+        with gauge_lock:
+            concurrency["active"] += 1
+            concurrency["max"] = max(concurrency["max"], concurrency["active"])
+        time_module.sleep(0.002)
+        with gauge_lock:
+            concurrency["active"] -= 1
+        return _envelope(raw_tasks[arguments["taskId"]])
+
+    client: Dict[str, object] = {"invoke_tool": invoke_tool}
+    storage_manager = create_storage_manager_with_tasks([])
+    manager = job_manager.create_job_manager(client, storage_manager)
+    results = job_manager.get_tasks(manager, ["task-86", "task-87", "task-88"])
+    assert len(results) == 3
+    assert concurrency["max"] == 1
+
+
+def test_get_tasks_allows_overlap_for_thread_safe_clients() -> None:
+    raw_task = create_serialized_task("task-89", "pending")
+
+    def invoke_tool(name: str, arguments: Dict[str, object]):
+        return _envelope(raw_task)
+
+    client: Dict[str, object] = {"invoke_tool": invoke_tool, "thread_safe": True}
+    storage_manager = create_storage_manager_with_tasks([])
+    manager = job_manager.create_job_manager(client, storage_manager)
+    assert manager.invoke is invoke_tool
+
+
+def test_list_tasks_sees_write_behind_saves_without_explicit_flush() -> None:
+    raw_task = create_serialized_task("task-99", "pending")
+
+    def responder(name: str, arguments: Dict[str, object]):
+        return _envelope(raw_task)
+
+    stub_client = create_stub_mcp_client(responder)
+    storage_manager = storage.create_in_memory_storage()
+    manager = job_manager.create_job_manager(stub_client, storage_manager, write_behind=True)
+    job_manager.get_task(manager, "task-99")
+    listed = job_manager.list_tasks(manager)
+    assert [task["id"] for task in listed] == ["task-99"]
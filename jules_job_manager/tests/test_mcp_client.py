@@ -1,3 +1,4 @@
+import os
 from contextlib import contextmanager
 from typing import Any, Dict
 
@@ -288,3 +289,164 @@ def test_read_response_malformed_json():
     client["process"] = StubProcess()
     with pytest.raises(RuntimeError):
         mcp_client.read_json_rpc_response(client)
+
+
+def test_invoke_tools_batch_roundtrip(monkeypatch):
+    request_data = {}
+    response_queue = [
+        "[{\"id\": \"2\", \"result\": {\"second\": true}}, {\"id\": \"1\", \"result\": {\"first\": true}}]\n"
+    ]
+
+    class StubProcess:
+        def __init__(self) -> None:
+            self.stdin = self
+            self.stdout = self
+
+        def write(self, value) -> None:
+            request_data.setdefault("writes", []).append(value)
+
+        def flush(self) -> None:
+            request_data["flushed"] = True
+
+        def readline(self):
+            return response_queue.pop(0)
+
+    client = mcp_client.create_client({"path": "server.js", "node_path": "node"})
+    client["process"] = StubProcess()
+    results = mcp_client.invoke_tools_batch(
+        client,
+        [("tools/call", {"name": "first"}), ("tools/call", {"name": "second"})],
+    )
+    assert len(request_data["writes"]) == 1
+    assert results == [{"first": True}, {"second": True}]
+
+
+def test_invoke_tools_batch_empty_calls():
+    client = mcp_client.create_client({"path": "server.js", "node_path": "node"})
+    assert mcp_client.invoke_tools_batch(client, []) == []
+
+
+def test_create_client_defaults_to_json_wire_format():
+    client = mcp_client.create_client({"path": "server.js", "node_path": "node"})
+    assert client["wire_format"] == "json"
+
+
+def test_create_client_rejects_unknown_wire_format():
+    with pytest.raises(ValueError):
+        mcp_client.create_client(
+            {"path": "server.js", "node_path": "node", "wire_format": "bson"}
+        )
+
+
+def test_invoke_tools_pipelined_matches_out_of_order_responses():
+    request_data = {}
+    response_queue = [
+        "{\"id\": \"2\", \"result\": {\"second\": true}}\n",
+        "{\"id\": \"1\", \"result\": {\"first\": true}}\n",
+    ]
+
+    class StubProcess:
+        def __init__(self) -> None:
+            self.stdin = self
+            self.stdout = self
+
+        def write(self, value) -> None:
+            request_data.setdefault("writes", []).append(value)
+
+        def flush(self) -> None:
+            request_data["flushed"] = True
+
+        def readline(self):
+            return response_queue.pop(0)
+
+    client = mcp_client.create_client({"path": "server.js", "node_path": "node"})
+    client["process"] = StubProcess()
+    results = mcp_client.invoke_tools_pipelined(
+        client,
+        [("tools/call", {"name": "first"}), ("tools/call", {"name": "second"})],
+    )
+    assert len(request_data["writes"]) == 1
+    assert results == [{"first": True}, {"second": True}]
+
+
+def test_read_response_buffers_multiple_frames_from_pipe():
+    read_fd, write_fd = os.pipe()
+    reader = os.fdopen(read_fd, "rb")
+
+    class StubProcess:
+        def __init__(self) -> None:
+            self.stdout = reader
+
+    client = mcp_client.create_client({"path": "server.js", "node_path": "node"})
+    client["process"] = StubProcess()
+    os.write(
+        write_fd,
+        b"{\"id\": \"1\", \"result\": \"first\"}\n{\"id\": \"2\", \"result\": \"second\"}\n",
+    )
+    first = mcp_client.read_json_rpc_response(client)
+    second = mcp_client.read_json_rpc_response(client)
+    assert first["result"] == "first"
+    assert second["result"] == "second"
+    os.close(write_fd)
+    reader.close()
+
+
+def test_create_client_from_file_caches_parsed_config(tmp_path, monkeypatch):
+    config = {"path": "server.js", "node_path": "node"}
+    config_path = tmp_path / "config.json"
+    config_path.write_text(mcp_client.dumps_json(config))
+    first = mcp_client.create_client_from_file(str(config_path))
+
+    def failing_loads(content):
+        raise AssertionError("config should have been served from cache")
+
+    monkeypatch.setattr(mcp_client, "loads_json", failing_loads)
+    second = mcp_client.create_client_from_file(str(config_path))
+    assert first["server_path"] == second["server_path"]
+
+
+def test_client_pool_reuses_started_clients(monkeypatch):
+    launches = []
+
+    def fake_launch(executable, args):
+        launches.append(executable)
+        return FakeProcess()
+
+    monkeypatch.setattr(mcp_client, "popen_launch", fake_launch)
+    pool = mcp_client.create_client_pool({"path": "server.js", "node_path": "node"}, size=1)
+    client = mcp_client.acquire_client(pool)
+    mcp_client.release_client(pool, client)
+    again = mcp_client.acquire_client(pool)
+    assert again is client
+    assert len(launches) == 1
+    mcp_client.release_client(pool, again)
+    mcp_client.close_pool(pool)
+    assert client["process"] is None
+
+
+def test_acquire_client_times_out_on_exhausted_pool(monkeypatch):
+    monkeypatch.setattr(mcp_client, "popen_launch", lambda executable, args: FakeProcess())
+    pool = mcp_client.create_client_pool({"path": "server.js", "node_path": "node"}, size=1)
+    client = mcp_client.acquire_client(pool)
+    with pytest.raises(RuntimeError):
+        mcp_client.acquire_client(pool, timeout=0.01)
+    mcp_client.release_client(pool, client)
+    mcp_client.close_pool(pool)
+
+
+def test_config_cache_keeps_one_entry_per_path(tmp_path, monkeypatch):
+    first_path = tmp_path / "first.json"
+    second_path = tmp_path / "second.json"
+    first_path.write_text(mcp_client.dumps_json({"path": "a.js", "node_path": "node"}))
+    second_path.write_text(mcp_client.dumps_json({"path": "b.js", "node_path": "node"}))
+    mcp_client.create_client_from_file(str(first_path))
+    mcp_client.create_client_from_file(str(second_path))
+
+    def failing_loads(content):
+        raise AssertionError("both configs should have been served from cache")
+
+    monkeypatch.setattr(mcp_client, "loads_json", failing_loads)
+    alternating = mcp_client.create_client_from_file(str(first_path))
+    assert alternating["server_path"] == "a.js"
+    alternating = mcp_client.create_client_from_file(str(second_path))
+    assert alternating["server_path"] == "b.js"
@@ -173,3 +173,41 @@ def test_jules_task_to_dict_handles_empty_lists():
     source_files = data["source_files"]
     assert chat_history == []
     assert source_files == []
+
+
+def test_normalize_task_dict_matches_round_trip():
+    data = {
+        "id": "task-102",
+        "title": "Normalize",
+        "description": "Single pass",
+        "repository": "owner/repo",
+        "branch": "main",
+        "status": "pending",
+        "created_at": "2025-01-01T09:00:00+00:00",
+        "updated_at": "2025-01-01T09:30:00+00:00",
+        "url": "https://example.com/task/102",
+        "chat_history": [],
+        "source_files": [],
+    }
+    normalized = models.normalize_task_dict(data)
+    round_tripped = models.jules_task_to_dict(models.jules_task_from_dict(data))
+    assert normalized == round_tripped
+
+
+def test_normalize_task_dict_rejects_invalid_status():
+    data = {
+        "id": "task-103",
+        "title": "Bad status",
+        "description": "Invalid",
+        "repository": "owner/repo",
+        "branch": "main",
+        "status": "unknown",
+        "created_at": "2025-01-01T09:00:00+00:00",
+        "updated_at": "2025-01-01T09:30:00+00:00",
+        "url": "https://example.com/task/103",
+    }
+    try:
+        models.normalize_task_dict(data)
+    except ValueError:
+        return
+    raise AssertionError("Expected ValueError for invalid status")
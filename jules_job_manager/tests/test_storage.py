@@ -111,3 +111,98 @@ def test_concurrent_access_uses_lock(tmp_path: Path):
     assert len(result) == 1
     assert result[0]["id"] == "task-7"
     assert result[0]["status"] == "pending"
+
+
+def test_storage_writer_coalesces_saves(tmp_path):
+    file_path = tmp_path / "tasks.json"
+    manager = storage.create_storage(str(file_path))
+    writer = storage.StorageWriter(manager)
+    first = {"id": "task-1", "status": "pending"}
+    second = {"id": "task-1", "status": "completed"}
+    writer.save(first)
+    writer.save(second)
+    writer.flush()
+    stored = storage.get_task(manager, "task-1")
+    assert stored["status"] == "completed"
+    writer.close()
+
+
+def test_storage_writer_rejects_saves_after_close(tmp_path):
+    file_path = tmp_path / "tasks.json"
+    manager = storage.create_storage(str(file_path))
+    writer = storage.StorageWriter(manager)
+    writer.close()
+    try:
+        writer.save({"id": "task-2", "status": "pending"})
+    except RuntimeError:
+        return
+    raise AssertionError("Expected RuntimeError after close")
+
+
+def test_mutations_replay_from_log_across_instances(tmp_path: Path):
+    tasks_file = tmp_path / "tasks.json"
+    manager_a = storage.create_storage(str(tasks_file))
+    storage.save_task(manager_a, create_sample_task("task-8"))
+    storage.save_task(manager_a, create_sample_task("task-9", "completed"))
+    storage.delete_task(manager_a, "task-8")
+    manager_b = storage.create_storage(str(tasks_file))
+    remaining = storage.list_tasks(manager_b)
+    assert len(remaining) == 1
+    assert remaining[0]["id"] == "task-9"
+
+
+def test_compact_folds_log_into_snapshot(tmp_path: Path):
+    tasks_file = tmp_path / "tasks.json"
+    manager = storage.create_storage(str(tasks_file))
+    storage.save_task(manager, create_sample_task("task-10"))
+    storage.compact(manager)
+    log_file = tmp_path / "tasks.log"
+    assert log_file.stat().st_size == 0
+    fresh = storage.create_storage(str(tasks_file))
+    retrieved = storage.get_task(fresh, "task-10")
+    assert retrieved["id"] == "task-10"
+
+
+def test_save_tasks_persists_batch(tmp_path: Path):
+    tasks_file = tmp_path / "tasks.json"
+    manager = storage.create_storage(str(tasks_file))
+    storage.save_tasks(
+        manager,
+        [create_sample_task("task-11"), create_sample_task("task-12", "completed")],
+    )
+    assert storage.get_task(manager, "task-11")["status"] == "pending"
+    assert storage.get_task(manager, "task-12")["status"] == "completed"
+
+
+def test_delete_tasks_requires_all_present(tmp_path: Path):
+    tasks_file = tmp_path / "tasks.json"
+    manager = storage.create_storage(str(tasks_file))
+    storage.save_task(manager, create_sample_task("task-13"))
+    with pytest.raises(KeyError):
+        storage.delete_tasks(manager, ["task-13", "missing"])
+    assert storage.get_task(manager, "task-13")["id"] == "task-13"
+    storage.delete_tasks(manager, ["task-13"])
+    with pytest.raises(KeyError):
+        storage.get_task(manager, "task-13")
+
+
+def test_in_memory_storage_roundtrip():
+    manager = storage.create_in_memory_storage()
+    storage.save_task(manager, create_sample_task("task-14"))
+    assert storage.get_task(manager, "task-14")["id"] == "task-14"
+    assert len(storage.list_tasks(manager, status="pending")) == 1
+    storage.delete_task(manager, "task-14")
+    with pytest.raises(KeyError):
+        storage.get_task(manager, "task-14")
+
+
+def test_storage_writer_surfaces_background_write_errors(tmp_path):
+    file_path = tmp_path / "tasks.json"
+    manager = storage.create_storage(str(file_path))
+    (tmp_path / "tasks.log").mkdir()
+    writer = storage.StorageWriter(manager)
+    writer.save(create_sample_task("task-15"))
+    with pytest.raises(RuntimeError):
+        writer.flush()
+    writer.flush()
+    writer.close()